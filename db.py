@@ -5,45 +5,439 @@ Provides database initialization, schema creation, and CRUD operations.
 
 import sqlite3
 import logging
+import queue
+import threading
+import atexit
+import time
 from contextlib import contextmanager
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Set
 import os
+from pathlib import Path
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers and levels are configured by the application
 logger = logging.getLogger(__name__)
 
 
 # Database file path
 DB_FILE = "chatlist.db"
 
+# Per-connection tuning, applied right after every connect.
+# journal_mode=WAL is persistent in the database file and is set once in init_database().
+_PRAGMA_SQL = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+    PRAGMA busy_timeout = 5000;
+"""
+
+# Minimum interval between PRAGMA optimize runs on released connections, seconds
+_OPTIMIZE_INTERVAL = 15 * 60
+
+# Database page size; larger pages suit the mid-length TEXT columns in results
+_PAGE_SIZE = 8192
+
+# Local-time ISO 8601 timestamp computed by SQLite, used for date columns
+_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+# Size of the per-connection prepared statement cache
+_CACHED_STATEMENTS = 256
+
+# Full-text search: trigram FTS5 tables mirroring prompts/results text columns.
+# The trigram tokenizer keeps the substring semantics of the former LIKE '%query%'
+# search, so queries shorter than _FTS_MIN_QUERY_LENGTH still go through LIKE.
+_FTS_MIN_QUERY_LENGTH = 3
+
+_FTS_TABLES_SQL = {
+    "prompts_fts": """
+        CREATE VIRTUAL TABLE prompts_fts USING fts5(
+            prompt, tags,
+            content='prompts', content_rowid='id', tokenize='trigram'
+        )
+    """,
+    "results_fts": """
+        CREATE VIRTUAL TABLE results_fts USING fts5(
+            response_text,
+            content='results', content_rowid='id', tokenize='trigram'
+        )
+    """
+}
+
+_FTS_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS prompts_fts_ai AFTER INSERT ON prompts BEGIN
+        INSERT INTO prompts_fts(rowid, prompt, tags) VALUES (new.id, new.prompt, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS prompts_fts_ad AFTER DELETE ON prompts BEGIN
+        INSERT INTO prompts_fts(prompts_fts, rowid, prompt, tags)
+        VALUES ('delete', old.id, old.prompt, old.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS prompts_fts_au AFTER UPDATE ON prompts BEGIN
+        INSERT INTO prompts_fts(prompts_fts, rowid, prompt, tags)
+        VALUES ('delete', old.id, old.prompt, old.tags);
+        INSERT INTO prompts_fts(rowid, prompt, tags) VALUES (new.id, new.prompt, new.tags);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS results_fts_ai AFTER INSERT ON results BEGIN
+        INSERT INTO results_fts(rowid, response_text) VALUES (new.id, new.response_text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS results_fts_ad AFTER DELETE ON results BEGIN
+        INSERT INTO results_fts(results_fts, rowid, response_text)
+        VALUES ('delete', old.id, old.response_text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS results_fts_au AFTER UPDATE ON results BEGIN
+        INSERT INTO results_fts(results_fts, rowid, response_text)
+        VALUES ('delete', old.id, old.response_text);
+        INSERT INTO results_fts(rowid, response_text) VALUES (new.id, new.response_text);
+    END
+    """
+)
+
+# Set by init_database() once the FTS tables are in place
+_fts_enabled = False
+
+# Batch size for incremental row fetching in search queries
+_FETCH_BATCH_SIZE = 1000
+
+# Number of leading prompt characters returned by get_prompts_summary()
+PROMPT_HEAD_LENGTH = 100
+
+# Pre-composed ORDER BY variants, so each sort maps to one stable cached statement
+_SORT_ORDERS = ("ASC", "DESC")
+_PROMPTS_SORT_FIELDS = ("id", "date", "prompt", "tags")
+_RESULTS_SORT_FIELDS = ("id", "prompt_id", "model_id", "saved_date")
+
+_PROMPTS_SORT_SQL = {
+    (field, order): f"""
+        SELECT id, date, prompt, tags
+        FROM prompts
+        ORDER BY {field} {order}
+        LIMIT ? OFFSET ?
+    """
+    for field in _PROMPTS_SORT_FIELDS
+    for order in _SORT_ORDERS
+}
+
+_RESULTS_SORT_SQL = {
+    (field, order): f"""
+        SELECT id, prompt_id, model_id, response_text, saved_date, metadata
+        FROM results
+        ORDER BY {field} {order}
+        LIMIT ? OFFSET ?
+    """
+    for field in _RESULTS_SORT_FIELDS
+    for order in _SORT_ORDERS
+}
+
+_RESULTS_BY_PROMPT_SORT_SQL = {
+    (field, order): f"""
+        SELECT id, prompt_id, model_id, response_text, saved_date, metadata
+        FROM results
+        WHERE prompt_id = ?
+        ORDER BY {field} {order}
+    """
+    for field in _RESULTS_SORT_FIELDS
+    for order in _SORT_ORDERS
+}
+
+
+def _limit_params(limit: Optional[int], offset: int) -> Tuple[int, int]:
+    """
+    Build LIMIT/OFFSET parameters for paged queries.
+    
+    Args:
+        limit [in]: Maximum number of rows, None for no limit
+        offset [in]: Number of rows to skip
+    
+    Returns:
+        Tuple[int, int]: Parameters for "LIMIT ? OFFSET ?" (-1 means no limit)
+    """
+    return (-1 if limit is None else limit, offset)
+
+
+def _unicode_lower(value: Any) -> Any:
+    """
+    Lowercase text for the py_lower() SQL function.
+    SQLite's lower() and LIKE fold only ASCII letters, which misses Cyrillic text.
+    
+    Args:
+        value [in]: Column or parameter value
+    
+    Returns:
+        Any: Lowercased text, other values (e.g. NULL tags) unchanged
+    """
+    return value.lower() if isinstance(value, str) else value
+
+
+def _like_pattern(query: str) -> str:
+    """
+    Build a case-folded substring pattern for "py_lower(column) LIKE ? ESCAPE '\\'".
+    
+    Args:
+        query [in]: Search query string
+    
+    Returns:
+        str: LIKE pattern with "%" and "_" in the query matched literally
+    """
+    # Local variables
+    escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
+    return f"%{escaped}%"
+
+
+# Settings statements, kept as fixed strings so every call hits the statement cache
+_GET_SETTING_SQL = "SELECT value FROM settings WHERE key = ?"
+_GET_ALL_SETTINGS_SQL = "SELECT key, value FROM settings"
+_SET_SETTING_SQL = f"""
+    INSERT INTO settings (key, value, updated_at)
+    VALUES (?, ?, {_NOW_SQL})
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = excluded.updated_at
+"""
+
+# Upper bound on cached prompt improvements; the oldest entries are evicted first
+_IMPROVE_CACHE_MAX_ENTRIES = 500
+
+# Cached prompt improvements older than this are treated as missing and purged
+_IMPROVE_CACHE_TTL_DAYS = 7
+_IMPROVE_CACHE_EXPIRY_SQL = (
+    f"strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime', '-{_IMPROVE_CACHE_TTL_DAYS} days')"
+)
+
+
+class _ConnectionPool:
+    """
+    Pool of long-lived SQLite connections.
+    Keeps per-connection page cache and PRAGMA state warm between calls.
+    """
+    
+    def __init__(self, maxsize: int = 8, read_only: bool = False):
+        """
+        Initialize connection pool.
+        
+        Args:
+            maxsize [in]: Maximum number of idle connections kept open
+            read_only [in]: Open connections with the read-only URI flag
+        """
+        # LIFO hands out the most recently used connection, whose caches are warmest
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+        self._read_only = read_only
+        self._optimize_lock = threading.Lock()
+        self._last_optimize = time.monotonic()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open and configure a new connection.
+        
+        Returns:
+            sqlite3.Connection: Configured database connection
+        """
+        # Local variables
+        database = DB_FILE
+        
+        if self._read_only:
+            # mode=ro skips write locking; WAL lets these readers run alongside writers
+            database = Path(DB_FILE).absolute().as_uri() + "?mode=ro"
+        
+        # Autocommit: reads run without a transaction, writes that span several
+        # statements open one explicitly through _transaction()
+        conn = sqlite3.connect(database, check_same_thread=False, isolation_level=None,
+                               cached_statements=_CACHED_STATEMENTS, uri=self._read_only)
+        conn.row_factory = sqlite3.Row
+        conn.create_function("py_lower", 1, _unicode_lower, deterministic=True)
+        # Enable foreign key constraints and apply performance tuning
+        conn.executescript(_PRAGMA_SQL)
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Take an idle connection from the pool or open a new one.
+        
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+    
+    def release(self, conn: sqlite3.Connection):
+        """
+        Return connection to the pool, closing it if the pool is full.
+        
+        Args:
+            conn [in]: Connection to release
+        """
+        try:
+            conn.rollback()
+            if not self._read_only and self._optimize_due():
+                self._optimize(conn)
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+    
+    def _optimize_due(self) -> bool:
+        """
+        Check whether the periodic PRAGMA optimize should run now.
+        
+        Returns:
+            bool: True if the interval has elapsed (and the timer was reset)
+        """
+        with self._optimize_lock:
+            now = time.monotonic()
+            if now - self._last_optimize < _OPTIMIZE_INTERVAL:
+                return False
+            self._last_optimize = now
+            return True
+    
+    @staticmethod
+    def _optimize(conn: sqlite3.Connection):
+        """
+        Refresh query planner statistics where SQLite considers them stale.
+        
+        Args:
+            conn [in]: Connection to run PRAGMA optimize on
+        """
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug("PRAGMA optimize failed: %s", e)
+    
+    def close_all(self):
+        """
+        Close all idle connections, running PRAGMA optimize before closing.
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if not self._read_only:
+                self._optimize(conn)
+            conn.close()
+
+
+_pool = _ConnectionPool(maxsize=8)
+_read_pool = _ConnectionPool(maxsize=8, read_only=True)
+atexit.register(_pool.close_all)
+atexit.register(_read_pool.close_all)
+
+# Connection currently in use by this thread (for nested get_db_connection calls)
+_local = threading.local()
+
+# In-memory copy of the models table keyed by ID (in name order), None until loaded.
+# _models_version is bumped on every write so a load racing with a write is discarded.
+_models_cache: Optional[Dict[int, Dict[str, Any]]] = None
+_models_version = 0
+_models_lock = threading.Lock()
+
+# Unpaged get_all_prompts() rows keyed by (sort_by, order) and the settings
+# mapping, None/empty until loaded; versions work as for the models cache.
+_prompts_cache: Dict[Tuple[str, str], List[sqlite3.Row]] = {}
+_prompts_version = 0
+_prompts_lock = threading.Lock()
+_settings_cache: Optional[Dict[str, str]] = None
+_settings_version = 0
+_settings_lock = threading.Lock()
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor, batch_size: int = _FETCH_BATCH_SIZE) -> List[Dict[str, Any]]:
+    """
+    Materialize cursor rows as dictionaries in fixed-size batches.
+    
+    Args:
+        cursor [in]: Cursor with an executed SELECT statement
+        batch_size [in]: Number of rows fetched per round-trip
+    
+    Returns:
+        List[Dict[str, Any]]: Rows converted to dictionaries
+    """
+    # Local variables
+    result = []
+    
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        result.extend(map(dict, rows))
+    
+    return result
+
 
 @contextmanager
-def get_db_connection():
+def get_db_connection(read_only: bool = False):
     """
     Context manager for database connections.
+    Nested calls within one thread reuse the outer connection and transaction.
+    
+    Args:
+        read_only [in]: Use a pooled read-only connection for pure SELECT paths
     
     Yields:
         sqlite3.Connection: Database connection object
     """
+    # Local variables
+    pool = _read_pool if read_only else _pool
+    
+    # Reuse connection of the enclosing call, so reads see its uncommitted writes
+    current = getattr(_local, "conn", None)
+    if current is not None:
+        yield current
+        return
+    
     conn = None
     try:
-        conn = sqlite3.connect(DB_FILE)
-        conn.row_factory = sqlite3.Row
-        # Enable foreign key constraints
-        conn.execute("PRAGMA foreign_keys = ON")
+        conn = pool.acquire()
+        # Only writable connections are shared with nested calls
+        if not read_only:
+            _local.conn = conn
         yield conn
-        conn.commit()
     except sqlite3.Error as e:
-        if conn:
+        if conn and conn.in_transaction:
             conn.rollback()
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         raise
     finally:
+        if not read_only:
+            _local.conn = None
         if conn:
-            conn.close()
+            pool.release(conn)
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """
+    Run a block of statements in one explicit write transaction.
+    Joins the enclosing transaction if one is already open. The write lock
+    is taken up front with BEGIN IMMEDIATE, which waits up to busy_timeout.
+    
+    Args:
+        conn [in]: Database connection object
+    """
+    if conn.in_transaction:
+        yield
+        return
+    
+    conn.execute("BEGIN IMMEDIATE")
+    
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
 
 
 def init_database():
@@ -55,11 +449,21 @@ def init_database():
         with get_db_connection() as conn:
             cursor = conn.cursor()
             
+            # Page size has to be settled before the database enters WAL mode
+            _migrate_page_size(cursor)
+            
+            # Switch to write-ahead logging (persistent per database file)
+            cursor.execute("PRAGMA journal_mode = WAL")
+            journal_mode = cursor.fetchone()[0]
+            if journal_mode.lower() != "wal":
+                # e.g. filesystems without shared memory support keep the old mode
+                logger.warning("WAL journal mode unavailable, using %s", journal_mode)
+            
             # Create prompts table
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS prompts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT NOT NULL,
+                    date TEXT NOT NULL DEFAULT ({_NOW_SQL}),
                     prompt TEXT NOT NULL,
                     tags TEXT
                 )
@@ -71,11 +475,8 @@ def init_database():
                 ON prompts(date)
             """)
             
-            # Create index on tags for filtering
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_prompts_tags 
-                ON prompts(tags)
-            """)
+            # Tags are matched by substring search, which cannot use a B-tree index
+            cursor.execute("DROP INDEX IF EXISTS idx_prompts_tags")
             
             # Create models table
             cursor.execute("""
@@ -96,13 +497,14 @@ def init_database():
                 columns = [row[1] for row in cursor.fetchall()]
                 
                 if "model_id" not in columns:
-                    cursor.execute("ALTER TABLE models ADD COLUMN model_id TEXT")
-                    # Set model_id = name for existing records
-                    cursor.execute("UPDATE models SET model_id = name WHERE model_id IS NULL OR model_id = ''")
+                    with _transaction(conn):
+                        cursor.execute("ALTER TABLE models ADD COLUMN model_id TEXT")
+                        # Set model_id = name for existing records
+                        cursor.execute("UPDATE models SET model_id = name WHERE model_id IS NULL OR model_id = ''")
                     logger.info("Added model_id column to existing models table")
             except sqlite3.OperationalError as e:
                 # Column already exists or other error, skip migration
-                logger.debug(f"Migration skipped: {e}")
+                logger.debug("Migration skipped: %s", e)
                 pass
             
             # Create index on is_active for filtering active models
@@ -112,19 +514,22 @@ def init_database():
             """)
             
             # Create results table
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS results (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     prompt_id INTEGER NOT NULL,
                     model_id INTEGER NOT NULL,
                     response_text TEXT NOT NULL,
-                    saved_date TEXT NOT NULL,
+                    saved_date TEXT NOT NULL DEFAULT ({_NOW_SQL}),
                     metadata TEXT,
-                    FOREIGN KEY (prompt_id) REFERENCES prompts(id),
+                    FOREIGN KEY (prompt_id) REFERENCES prompts(id) ON DELETE CASCADE,
                     FOREIGN KEY (model_id) REFERENCES models(id)
                 )
             """)
             
+            # Migrate existing results table to cascade deletes from prompts
+            _migrate_results_cascade(conn)
+            
             # Create indexes on results table
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_results_prompt_id 
@@ -141,26 +546,213 @@ def init_database():
                 ON results(saved_date)
             """)
             
-            # Create settings table
-            cursor.execute("""
+            # Create settings table, clustered on key so lookups and UPSERTs
+            # go through a single B-tree (existing databases keep their layout)
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS settings (
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
+                    updated_at TEXT NOT NULL DEFAULT ({_NOW_SQL})
+                ) WITHOUT ROWID
             """)
             
-            # Initialize default settings
-            init_default_settings(cursor)
+            # Create cache of prompt improvement results keyed by request hash
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS prompt_improve_cache (
+                    key TEXT PRIMARY KEY,
+                    result_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT ({_NOW_SQL})
+                ) WITHOUT ROWID
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_prompt_improve_cache_created_at
+                ON prompt_improve_cache(created_at)
+            """)
+            
+            with _transaction(conn):
+                # Initialize default settings
+                init_default_settings(cursor)
+                
+                # Create full-text search indexes for prompts and results
+                _init_fulltext_search(cursor)
+            _invalidate_settings_cache()
+            
+            # Seed query planner statistics on first run
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
             
-            conn.commit()
             logger.info("Database initialized successfully")
             
     except sqlite3.Error as e:
-        logger.error(f"Error initializing database: {e}")
+        logger.error("Error initializing database: %s", e)
         raise
 
 
+def _migrate_page_size(cursor: sqlite3.Cursor):
+    """
+    Switch the database file to _PAGE_SIZE pages.
+    A new database gets the page size before its first table is written;
+    an existing one is rebuilt once with VACUUM, which cannot change the
+    page size in WAL mode, so the journal is switched to DELETE first.
+    
+    Args:
+        cursor [in]: Database cursor object
+    """
+    cursor.execute("PRAGMA page_size")
+    if cursor.fetchone()[0] == _PAGE_SIZE:
+        return
+    
+    cursor.execute("SELECT COUNT(*) FROM sqlite_master")
+    is_new = cursor.fetchone()[0] == 0
+    
+    try:
+        if is_new:
+            cursor.execute(f"PRAGMA page_size = {_PAGE_SIZE}")
+            return
+        
+        cursor.execute("PRAGMA journal_mode = DELETE")
+        cursor.execute(f"PRAGMA page_size = {_PAGE_SIZE}")
+        cursor.execute("VACUUM")
+        logger.info("Rebuilt database with page size %s", _PAGE_SIZE)
+    except sqlite3.OperationalError as e:
+        # Another connection holds the file; keep the current page size
+        logger.warning("Page size migration skipped: %s", e)
+
+
+def _migrate_results_cascade(conn: sqlite3.Connection):
+    """
+    Rebuild the results table if its prompt foreign key lacks ON DELETE CASCADE.
+    Uses the create-copy-drop-rename sequence, since SQLite cannot alter
+    constraints in place. Row IDs are preserved.
+    
+    Args:
+        conn [in]: Database connection object
+    """
+    # Local variables
+    cursor = conn.cursor()
+    
+    cursor.execute("PRAGMA foreign_key_list(results)")
+    needs_migration = any(
+        row["table"] == "prompts" and row["on_delete"].upper() != "CASCADE"
+        for row in cursor.fetchall()
+    )
+    if not needs_migration:
+        return
+    
+    # Foreign key enforcement can only be toggled outside a transaction
+    cursor.execute("PRAGMA foreign_keys = OFF")
+    try:
+        with _transaction(conn):
+            cursor.execute(f"""
+                CREATE TABLE results_new (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    prompt_id INTEGER NOT NULL,
+                    model_id INTEGER NOT NULL,
+                    response_text TEXT NOT NULL,
+                    saved_date TEXT NOT NULL DEFAULT ({_NOW_SQL}),
+                    metadata TEXT,
+                    FOREIGN KEY (prompt_id) REFERENCES prompts(id) ON DELETE CASCADE,
+                    FOREIGN KEY (model_id) REFERENCES models(id)
+                )
+            """)
+            cursor.execute("""
+                INSERT INTO results_new (id, prompt_id, model_id, response_text, saved_date, metadata)
+                SELECT id, prompt_id, model_id, response_text, saved_date, metadata
+                FROM results
+            """)
+            cursor.execute("DROP TABLE results")
+            cursor.execute("ALTER TABLE results_new RENAME TO results")
+        logger.info("Migrated results table to ON DELETE CASCADE")
+    finally:
+        cursor.execute("PRAGMA foreign_keys = ON")
+
+
+def _init_fulltext_search(cursor: sqlite3.Cursor):
+    """
+    Create FTS5 tables and sync triggers for prompt and result search.
+    Newly created tables are populated from existing rows. If the SQLite
+    build lacks FTS5 or the trigram tokenizer, search keeps using LIKE.
+    
+    Args:
+        cursor [in]: Database cursor object
+    """
+    global _fts_enabled
+    
+    try:
+        for table, create_sql in _FTS_TABLES_SQL.items():
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,)
+            )
+            if cursor.fetchone() is None:
+                cursor.execute(create_sql)
+                cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+                logger.info("Created full-text search table %s", table)
+        
+        for trigger_sql in _FTS_TRIGGERS_SQL:
+            cursor.execute(trigger_sql)
+        
+        _fts_enabled = True
+        
+    except sqlite3.OperationalError as e:
+        logger.warning("Full-text search unavailable, using LIKE search: %s", e)
+        _fts_enabled = False
+
+
+def _fts_phrase(query: str) -> Optional[str]:
+    """
+    Convert a user query into a quoted FTS5 phrase.
+    
+    Args:
+        query [in]: Search query string
+    
+    Returns:
+        Optional[str]: FTS5 MATCH expression or None if LIKE search should be used
+    """
+    if not _fts_enabled or len(query) < _FTS_MIN_QUERY_LENGTH:
+        return None
+    return '"' + query.replace('"', '""') + '"'
+
+
+def _search_terms(query: str) -> List[str]:
+    """
+    Split a prompt search query into alternative terms.
+    A comma-separated query (e.g. a list of tags) matches any of its terms.
+    
+    Args:
+        query [in]: Search query string
+    
+    Returns:
+        List[str]: Search terms (empty if the query selects all prompts)
+    """
+    if "," not in query:
+        return [query] if query else []
+    return [term.strip() for term in query.split(",") if term.strip()]
+
+
+def narrows_search(old_query: str, new_query: str) -> bool:
+    """
+    Check whether every prompt matching new_query also matches old_query.
+    
+    Args:
+        old_query [in]: Previous search query string
+        new_query [in]: New search query string
+    
+    Returns:
+        bool: True if new_query can only narrow the results of old_query
+    """
+    # Comma-separated queries widen with more terms; py_lower() and the trigram
+    # index may fold some characters differently, so both queries use the same path
+    if not old_query or "," in old_query or "," in new_query:
+        return False
+    return (new_query.startswith(old_query)
+            and (_fts_phrase(old_query) is None) == (_fts_phrase(new_query) is None))
+
+
 def init_default_settings(cursor: sqlite3.Cursor):
     """
     Initialize default settings in the settings table.
@@ -179,16 +771,11 @@ def init_default_settings(cursor: sqlite3.Cursor):
         ("default_adaptation_type", "general")
     ]
     
-    current_time = datetime.now().isoformat()
-    
-    for key, value in default_settings:
-        # Check if setting already exists
-        cursor.execute("SELECT key FROM settings WHERE key = ?", (key,))
-        if not cursor.fetchone():
-            cursor.execute("""
-                INSERT INTO settings (key, value, updated_at)
-                VALUES (?, ?, ?)
-            """, (key, value, current_time))
+    # Existing keys are skipped by the PRIMARY KEY on settings.key
+    cursor.executemany(f"""
+        INSERT OR IGNORE INTO settings (key, value, updated_at)
+        VALUES (?, ?, {_NOW_SQL})
+    """, default_settings)
 
 
 # CRUD operations for prompts table
@@ -207,20 +794,53 @@ def create_prompt(prompt_text: str, tags: Optional[str] = None) -> int:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
             
-            cursor.execute("""
+            cursor.execute(f"""
                 INSERT INTO prompts (date, prompt, tags)
-                VALUES (?, ?, ?)
-            """, (current_time, prompt_text, tags))
+                VALUES ({_NOW_SQL}, ?, ?)
+            """, (prompt_text, tags))
             
             prompt_id = cursor.lastrowid
-            logger.info(f"Created prompt with ID: {prompt_id}")
+            logger.info("Created prompt with ID: %s", prompt_id)
             return prompt_id
             
     except sqlite3.Error as e:
-        logger.error(f"Error creating prompt: {e}")
+        logger.error("Error creating prompt: %s", e)
         raise
+    finally:
+        _invalidate_prompts_cache()
+
+
+def create_prompts_bulk(items: List[Tuple[str, Optional[str]]]) -> int:
+    """
+    Create several prompts in a single transaction.
+    
+    Args:
+        items [in]: List of (prompt_text, tags) tuples
+    
+    Returns:
+        int: Number of created prompts
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Insert the whole batch in one transaction
+            with _transaction(conn):
+                cursor.executemany(f"""
+                    INSERT INTO prompts (date, prompt, tags)
+                    VALUES ({_NOW_SQL}, ?, ?)
+                """, items)
+            
+            created_count = cursor.rowcount
+            logger.info("Created %s prompt(s)", created_count)
+            return created_count
+            
+    except sqlite3.Error as e:
+        logger.error("Error creating prompts: %s", e)
+        raise
+    finally:
+        _invalidate_prompts_cache()
 
 
 def get_prompt(prompt_id: int) -> Optional[Dict[str, Any]]:
@@ -243,63 +863,138 @@ def get_prompt(prompt_id: int) -> Optional[Dict[str, Any]]:
             """, (prompt_id,))
             
             row = cursor.fetchone()
-            if row:
-                return {
-                    "id": row["id"],
-                    "date": row["date"],
-                    "prompt": row["prompt"],
-                    "tags": row["tags"]
-                }
-            return None
+            return dict(row) if row else None
+            
+    except sqlite3.Error as e:
+        logger.error("Error getting prompt: %s", e)
+        raise
+
+
+def get_prompt_with_results(prompt_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get a prompt together with its saved results in one query.
+    
+    Args:
+        prompt_id [in]: ID of the prompt
+    
+    Returns:
+        Optional[Dict[str, Any]]: Prompt data with a "results" list (newest first)
+            or None if not found
+    """
+    try:
+        with get_db_connection(read_only=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT p.id, p.date, p.prompt, p.tags,
+                       r.id AS result_id, r.model_id, r.response_text,
+                       r.saved_date, r.metadata
+                FROM prompts p
+                LEFT JOIN results r ON r.prompt_id = p.id
+                WHERE p.id = ?
+                ORDER BY r.saved_date DESC
+            """, (prompt_id,))
+            
+            rows = cursor.fetchall()
+            if not rows:
+                return None
+            
+            first = rows[0]
+            return {
+                "id": first["id"],
+                "date": first["date"],
+                "prompt": first["prompt"],
+                "tags": first["tags"],
+                "results": [
+                    {
+                        "id": row["result_id"],
+                        "prompt_id": first["id"],
+                        "model_id": row["model_id"],
+                        "response_text": row["response_text"],
+                        "saved_date": row["saved_date"],
+                        "metadata": row["metadata"]
+                    }
+                    for row in rows
+                    if row["result_id"] is not None
+                ]
+            }
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting prompt: {e}")
+        logger.error("Error getting prompt with results: %s", e)
         raise
 
 
-def get_all_prompts(sort_by: str = "date", order: str = "DESC") -> List[Dict[str, Any]]:
+def get_all_prompts(sort_by: str = "date", order: str = "DESC",
+                    as_dict: bool = True, limit: Optional[int] = None,
+                    offset: int = 0) -> List[Any]:
     """
     Get all prompts from the database.
+    Unpaged results are served from an in-memory cache until the next prompt write.
     
     Args:
         sort_by [in]: Field to sort by (default: "date")
         order [in]: Sort order "ASC" or "DESC" (default: "DESC")
+        as_dict [in]: Convert rows to dictionaries; False returns sqlite3.Row
+            objects for read-only callers (default: True)
+        limit [in]: Maximum number of rows to return (default: None, no limit)
+        offset [in]: Number of rows to skip (default: 0)
     
     Returns:
-        List[Dict[str, Any]]: List of prompts
+        List[Any]: List of prompts as dictionaries or sqlite3.Row objects
+    """
+    # Only whitelisted sort fields and orders have a statement
+    if sort_by not in _PROMPTS_SORT_FIELDS:
+        sort_by = "date"
+    order = order.upper()
+    if order not in _SORT_ORDERS:
+        order = "DESC"
+    
+    # Local variables
+    key = (sort_by, order)
+    cacheable = limit is None and offset == 0
+    rows = None
+    
+    if cacheable:
+        with _prompts_lock:
+            rows = _prompts_cache.get(key)
+            version = _prompts_version
+    
+    if rows is None:
+        try:
+            with get_db_connection(read_only=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(_PROMPTS_SORT_SQL[key], _limit_params(limit, offset))
+                rows = cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            logger.error("Error getting prompts: %s", e)
+            raise
+        
+        if cacheable:
+            with _prompts_lock:
+                if _prompts_version == version:
+                    _prompts_cache[key] = rows
+    
+    # sqlite3.Row is immutable, so only the list itself needs copying
+    if not as_dict:
+        return list(rows)
+    return [dict(row) for row in rows]
+
+
+def count_prompts() -> int:
+    """
+    Get the number of prompts in the database.
+    
+    Returns:
+        int: Number of prompts
     """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            
-            # Validate sort_by field
-            valid_fields = ["id", "date", "prompt", "tags"]
-            if sort_by not in valid_fields:
-                sort_by = "date"
-            
-            # Validate order
-            if order not in ["ASC", "DESC"]:
-                order = "DESC"
-            
-            cursor.execute(f"""
-                SELECT id, date, prompt, tags
-                FROM prompts
-                ORDER BY {sort_by} {order}
-            """)
-            
-            rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "date": row["date"],
-                    "prompt": row["prompt"],
-                    "tags": row["tags"]
-                }
-                for row in rows
-            ]
+            cursor.execute("SELECT COUNT(*) FROM prompts")
+            return cursor.fetchone()[0]
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting prompts: {e}")
+        logger.error("Error counting prompts: %s", e)
         raise
 
 
@@ -345,12 +1040,14 @@ def update_prompt(prompt_id: int, prompt_text: Optional[str] = None,
             
             success = cursor.rowcount > 0
             if success:
-                logger.info(f"Updated prompt with ID: {prompt_id}")
+                logger.info("Updated prompt with ID: %s", prompt_id)
             return success
             
     except sqlite3.Error as e:
-        logger.error(f"Error updating prompt: {e}")
+        logger.error("Error updating prompt: %s", e)
         raise
+    finally:
+        _invalidate_prompts_cache()
 
 
 def delete_prompt(prompt_id: int) -> bool:
@@ -368,23 +1065,19 @@ def delete_prompt(prompt_id: int) -> bool:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             
-            # Delete all related results first (due to foreign key constraint)
-            cursor.execute("DELETE FROM results WHERE prompt_id = ?", (prompt_id,))
-            results_deleted = cursor.rowcount
-            if results_deleted > 0:
-                logger.info(f"Deleted {results_deleted} related result(s) for prompt {prompt_id}")
-            
-            # Delete the prompt
+            # Related results are removed by ON DELETE CASCADE
             cursor.execute("DELETE FROM prompts WHERE id = ?", (prompt_id,))
             
             success = cursor.rowcount > 0
             if success:
-                logger.info(f"Deleted prompt with ID: {prompt_id}")
+                logger.info("Deleted prompt with ID: %s", prompt_id)
             return success
             
     except sqlite3.Error as e:
-        logger.error(f"Error deleting prompt: {e}")
+        logger.error("Error deleting prompt: %s", e)
         raise
+    finally:
+        _invalidate_prompts_cache()
 
 
 def delete_all_prompts() -> int:
@@ -398,63 +1091,155 @@ def delete_all_prompts() -> int:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            # Get count before deletion
-            cursor.execute("SELECT COUNT(*) FROM prompts")
-            count = cursor.fetchone()[0]
-            
-            # Delete all related results first (due to foreign key constraint)
-            cursor.execute("DELETE FROM results")
-            results_deleted = cursor.rowcount
-            if results_deleted > 0:
-                logger.info(f"Deleted {results_deleted} related result(s)")
             
-            # Delete all prompts
+            # Delete all prompts; related results are removed by ON DELETE CASCADE
             cursor.execute("DELETE FROM prompts")
             
             deleted_count = cursor.rowcount
-            logger.info(f"Deleted {deleted_count} prompt(s)")
+            logger.info("Deleted %s prompt(s)", deleted_count)
             return deleted_count
             
     except sqlite3.Error as e:
-        logger.error(f"Error deleting all prompts: {e}")
+        logger.error("Error deleting all prompts: %s", e)
         raise
+    finally:
+        _invalidate_prompts_cache()
+
+
+def _query_prompts(columns: str, query: str, limit: Optional[int], offset: int,
+                   sort_by: str, order: str, split_terms: bool) -> List[Dict[str, Any]]:
+    """
+    Select prompts, optionally filtered by text or tags, with whitelisted sorting.
+    
+    Args:
+        columns [in]: Select list over the prompts table aliased as "p"
+        query [in]: Search query string (empty selects all prompts)
+        limit [in]: Maximum number of rows to return (None for no limit)
+        offset [in]: Number of rows to skip
+        sort_by [in]: Field to sort by
+        order [in]: Sort order "ASC" or "DESC"
+        split_terms [in]: Treat comma-separated terms as alternatives
+    
+    Returns:
+        List[Dict[str, Any]]: List of prompts
+    """
+    # Local variables
+    terms = _search_terms(query) if split_terms else ([query] if query else [])
+    phrases = []
+    like_terms = []
+    
+    # Only whitelisted sort fields and orders reach the statement
+    if sort_by not in _PROMPTS_SORT_FIELDS:
+        sort_by = "date"
+    order = order.upper()
+    if order not in _SORT_ORDERS:
+        order = "DESC"
+    
+    # Each term takes its own path: long ones the trigram index, short ones LIKE
+    for term in terms:
+        phrase = _fts_phrase(term)
+        if phrase:
+            phrases.append(phrase)
+        else:
+            like_terms.append(term)
+    
+    with get_db_connection(read_only=True) as conn:
+        cursor = conn.cursor()
+        
+        if phrases and not like_terms:
+            # One MATCH expression covers every term in a single index lookup
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM prompts p
+                JOIN prompts_fts ON prompts_fts.rowid = p.id
+                WHERE prompts_fts MATCH ?
+                ORDER BY p.{sort_by} {order}
+                LIMIT ? OFFSET ?
+            """, (" OR ".join(phrases), *_limit_params(limit, offset)))
+        elif like_terms:
+            conditions = [
+                "py_lower(p.prompt) LIKE ? ESCAPE '\\' OR py_lower(p.tags) LIKE ? ESCAPE '\\'"
+            ] * len(like_terms)
+            params = []
+            for term in like_terms:
+                params.extend((_like_pattern(term), _like_pattern(term)))
+            if phrases:
+                conditions.append("p.id IN (SELECT rowid FROM prompts_fts WHERE prompts_fts MATCH ?)")
+                params.append(" OR ".join(phrases))
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM prompts p
+                WHERE {" OR ".join(conditions)}
+                ORDER BY p.{sort_by} {order}
+                LIMIT ? OFFSET ?
+            """, (*params, *_limit_params(limit, offset)))
+        else:
+            cursor.execute(f"""
+                SELECT {columns}
+                FROM prompts p
+                ORDER BY p.{sort_by} {order}
+                LIMIT ? OFFSET ?
+            """, _limit_params(limit, offset))
+        
+        return _fetch_dicts(cursor)
 
 
-def search_prompts(query: str) -> List[Dict[str, Any]]:
+def search_prompts(query: str, limit: Optional[int] = None,
+                   offset: int = 0, sort_by: str = "date",
+                   order: str = "DESC", split_terms: bool = False) -> List[Dict[str, Any]]:
     """
     Search prompts by text or tags.
     
     Args:
         query [in]: Search query string
+        limit [in]: Maximum number of rows to return (default: None, no limit)
+        offset [in]: Number of rows to skip (default: 0)
+        sort_by [in]: Field to sort by (default: "date")
+        order [in]: Sort order "ASC" or "DESC" (default: "DESC")
+        split_terms [in]: Split the query on commas and match prompts containing
+            any of the terms (default: False, the query is one literal substring)
     
     Returns:
         List[Dict[str, Any]]: List of matching prompts
     """
     try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            search_pattern = f"%{query}%"
-            
-            cursor.execute("""
-                SELECT id, date, prompt, tags
-                FROM prompts
-                WHERE prompt LIKE ? OR tags LIKE ?
-                ORDER BY date DESC
-            """, (search_pattern, search_pattern))
-            
-            rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "date": row["date"],
-                    "prompt": row["prompt"],
-                    "tags": row["tags"]
-                }
-                for row in rows
-            ]
-            
+        return _query_prompts(
+            "p.id, p.date, p.prompt, p.tags", query, limit, offset, sort_by, order, split_terms
+        )
+        
     except sqlite3.Error as e:
-        logger.error(f"Error searching prompts: {e}")
+        logger.error("Error searching prompts: %s", e)
+        raise
+
+
+def get_prompts_summary(query: str = "", limit: Optional[int] = None,
+                        offset: int = 0, sort_by: str = "date",
+                        order: str = "DESC", split_terms: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get prompts for listing without loading full prompt texts.
+    
+    Args:
+        query [in]: Optional search query string (default: "", all prompts)
+        limit [in]: Maximum number of rows to return (default: None, no limit)
+        offset [in]: Number of rows to skip (default: 0)
+        sort_by [in]: Field to sort by (default: "date")
+        order [in]: Sort order "ASC" or "DESC" (default: "DESC")
+        split_terms [in]: Split the query on commas and match prompts containing
+            any of the terms (default: False, the query is one literal substring)
+    
+    Returns:
+        List[Dict[str, Any]]: Prompts with id, date, tags, prompt_head (first
+            PROMPT_HEAD_LENGTH + 1 characters) and prompt_len fields
+    """
+    try:
+        return _query_prompts(
+            f"p.id, p.date, substr(p.prompt, 1, {PROMPT_HEAD_LENGTH + 1}) AS prompt_head, "
+            "length(p.prompt) AS prompt_len, p.tags",
+            query, limit, offset, sort_by, order, split_terms
+        )
+        
+    except sqlite3.Error as e:
+        logger.error("Error getting prompts summary: %s", e)
         raise
 
 
@@ -482,26 +1267,16 @@ def create_model(name: str, model_id: str, api_url: str, api_id: str, is_active:
         with get_db_connection() as conn:
             cursor = conn.cursor()
             
-            # Check if model with this name already exists
-            cursor.execute("SELECT id FROM models WHERE name = ?", (name,))
-            existing = cursor.fetchone()
-            if existing:
-                error_msg = f"Модель с названием '{name}' уже существует"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-            
+            # Duplicate names are rejected by the UNIQUE constraint on models.name
             cursor.execute("""
                 INSERT INTO models (name, model_id, api_url, api_id, is_active)
                 VALUES (?, ?, ?, ?, ?)
             """, (name, model_id, api_url, api_id, is_active))
             
             model_id = cursor.lastrowid
-            logger.info(f"Created model with ID: {model_id}")
+            logger.info("Created model with ID: %s", model_id)
             return model_id
             
-    except ValueError:
-        # Re-raise ValueError as-is
-        raise
     except sqlite3.IntegrityError as e:
         # Handle UNIQUE constraint violation
         if "UNIQUE constraint failed: models.name" in str(e):
@@ -510,43 +1285,122 @@ def create_model(name: str, model_id: str, api_url: str, api_id: str, is_active:
             raise ValueError(error_msg)
         raise
     except sqlite3.Error as e:
-        logger.error(f"Error creating model: {e}")
+        logger.error("Error creating model: %s", e)
         raise
+    finally:
+        _invalidate_models_cache()
 
 
-def get_model(model_id: int) -> Optional[Dict[str, Any]]:
+def create_models_bulk(items: List[Tuple[str, str, str, str, int]]) -> int:
     """
-    Get a model by ID.
+    Create several models in a single transaction.
+    Models whose name already exists are skipped.
     
     Args:
-        model_id [in]: ID of the model
+        items [in]: List of (name, model_id, api_url, api_id, is_active) tuples
     
     Returns:
-        Optional[Dict[str, Any]]: Model data or None if not found
+        int: Number of created models
     """
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, model_id, api_url, api_id, is_active
-                FROM models
-                WHERE id = ?
-            """, (model_id,))
             
-            row = cursor.fetchone()
-            if row:
-                return {
-                    "id": row["id"],
-                    "name": row["name"],
-                    "model_id": row["model_id"],
-                    "api_url": row["api_url"],
-                    "api_id": row["api_id"],
-                    "is_active": row["is_active"]
-                }
-            return None
+            # Insert the whole batch in one transaction
+            with _transaction(conn):
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO models (name, model_id, api_url, api_id, is_active)
+                    VALUES (?, ?, ?, ?, ?)
+                """, items)
+            
+            created_count = cursor.rowcount
+            logger.info("Created %s model(s)", created_count)
+            return created_count
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting model: {e}")
+        logger.error("Error creating models: %s", e)
+        raise
+    finally:
+        _invalidate_models_cache()
+
+
+def _invalidate_prompts_cache():
+    """
+    Drop cached prompt lists so the next read reloads them from the database.
+    """
+    global _prompts_version
+    
+    with _prompts_lock:
+        _prompts_cache.clear()
+        _prompts_version += 1
+
+
+def _invalidate_models_cache():
+    """
+    Drop cached models so the next read reloads them from the database.
+    """
+    global _models_cache, _models_version
+    
+    with _models_lock:
+        _models_cache = None
+        _models_version += 1
+
+
+def get_models_version() -> int:
+    """
+    Get the models cache version, bumped on every write to the models table.
+    
+    Returns:
+        int: Current models cache version
+    """
+    return _models_version
+
+
+def _load_models() -> Dict[int, Dict[str, Any]]:
+    """
+    Get all models keyed by ID, loading them from the database on cache miss.
+    
+    Returns:
+        Dict[int, Dict[str, Any]]: Models keyed by ID, ordered by name
+    """
+    global _models_cache
+    
+    with _models_lock:
+        if _models_cache is not None:
+            return _models_cache
+        version = _models_version
+    
+    with get_db_connection(read_only=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, name, model_id, api_url, api_id, is_active
+            FROM models
+            ORDER BY name
+        """)
+        loaded = {row["id"]: dict(row) for row in cursor.fetchall()}
+    
+    with _models_lock:
+        if _models_version == version:
+            _models_cache = loaded
+    return loaded
+
+
+def get_model(model_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get a model by ID.
+    
+    Args:
+        model_id [in]: ID of the model
+    
+    Returns:
+        Optional[Dict[str, Any]]: Model data or None if not found
+    """
+    try:
+        model = _load_models().get(model_id)
+        return dict(model) if model else None
+        
+    except sqlite3.Error as e:
+        logger.error("Error getting model: %s", e)
         raise
 
 
@@ -558,29 +1412,10 @@ def get_all_models() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of models
     """
     try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, model_id, api_url, api_id, is_active
-                FROM models
-                ORDER BY name
-            """)
-            
-            rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "name": row["name"],
-                    "model_id": row["model_id"],
-                    "api_url": row["api_url"],
-                    "api_id": row["api_id"],
-                    "is_active": row["is_active"]
-                }
-                for row in rows
-            ]
-            
+        return [dict(model) for model in _load_models().values()]
+        
     except sqlite3.Error as e:
-        logger.error(f"Error getting models: {e}")
+        logger.error("Error getting models: %s", e)
         raise
 
 
@@ -592,30 +1427,58 @@ def get_active_models() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of active models
     """
     try:
-        with get_db_connection() as conn:
+        return [
+            dict(model) for model in _load_models().values()
+            if model["is_active"] == 1
+        ]
+        
+    except sqlite3.Error as e:
+        logger.error("Error getting active models: %s", e)
+        raise
+
+
+def get_existing_model_names(names: List[str]) -> Set[str]:
+    """
+    Get which of the given model names already exist in the database.
+    
+    Args:
+        names [in]: Model names to check
+    
+    Returns:
+        Set[str]: Subset of names that are present in the models table
+    """
+    if not names:
+        return set()
+    
+    try:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, model_id, api_url, api_id, is_active
-                FROM models
-                WHERE is_active = 1
-                ORDER BY name
-            """)
+            placeholders = ", ".join("?" * len(names))
+            cursor.execute(
+                f"SELECT name FROM models WHERE name IN ({placeholders})", names
+            )
+            return {row["name"] for row in cursor.fetchall()}
             
-            rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "name": row["name"],
-                    "model_id": row["model_id"],
-                    "api_url": row["api_url"],
-                    "api_id": row["api_id"],
-                    "is_active": row["is_active"]
-                }
-                for row in rows
-            ]
+    except sqlite3.Error as e:
+        logger.error("Error checking model names: %s", e)
+        raise
+
+
+def count_models() -> int:
+    """
+    Get the number of models in the database.
+    
+    Returns:
+        int: Number of models
+    """
+    try:
+        with get_db_connection(read_only=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM models")
+            return cursor.fetchone()[0]
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting active models: {e}")
+        logger.error("Error counting models: %s", e)
         raise
 
 
@@ -678,12 +1541,14 @@ def update_model(model_id: int, name: Optional[str] = None,
             
             success = cursor.rowcount > 0
             if success:
-                logger.info(f"Updated model with ID: {model_id}")
+                logger.info("Updated model with ID: %s", model_id)
             return success
             
     except sqlite3.Error as e:
-        logger.error(f"Error updating model: {e}")
+        logger.error("Error updating model: %s", e)
         raise
+    finally:
+        _invalidate_models_cache()
 
 
 def delete_model(model_id: int) -> bool:
@@ -703,12 +1568,14 @@ def delete_model(model_id: int) -> bool:
             
             success = cursor.rowcount > 0
             if success:
-                logger.info(f"Deleted model with ID: {model_id}")
+                logger.info("Deleted model with ID: %s", model_id)
             return success
             
     except sqlite3.Error as e:
-        logger.error(f"Error deleting model: {e}")
+        logger.error("Error deleting model: %s", e)
         raise
+    finally:
+        _invalidate_models_cache()
 
 
 # CRUD operations for results table
@@ -730,19 +1597,48 @@ def create_result(prompt_id: int, model_id: int, response_text: str,
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
             
-            cursor.execute("""
+            cursor.execute(f"""
                 INSERT INTO results (prompt_id, model_id, response_text, saved_date, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """, (prompt_id, model_id, response_text, current_time, metadata))
+                VALUES (?, ?, ?, {_NOW_SQL}, ?)
+            """, (prompt_id, model_id, response_text, metadata))
             
             result_id = cursor.lastrowid
-            logger.info(f"Created result with ID: {result_id}")
+            logger.info("Created result with ID: %s", result_id)
             return result_id
             
     except sqlite3.Error as e:
-        logger.error(f"Error creating result: {e}")
+        logger.error("Error creating result: %s", e)
+        raise
+
+
+def create_results_bulk(items: List[Tuple[int, int, str, Optional[str]]]) -> int:
+    """
+    Create several results in a single transaction.
+    
+    Args:
+        items [in]: List of (prompt_id, model_id, response_text, metadata) tuples
+    
+    Returns:
+        int: Number of created results
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Insert the whole batch in one transaction
+            with _transaction(conn):
+                cursor.executemany(f"""
+                    INSERT INTO results (prompt_id, model_id, response_text, saved_date, metadata)
+                    VALUES (?, ?, ?, {_NOW_SQL}, ?)
+                """, items)
+            
+            created_count = cursor.rowcount
+            logger.info("Created %s result(s)", created_count)
+            return created_count
+            
+    except sqlite3.Error as e:
+        logger.error("Error creating results: %s", e)
         raise
 
 
@@ -766,23 +1662,15 @@ def get_result(result_id: int) -> Optional[Dict[str, Any]]:
             """, (result_id,))
             
             row = cursor.fetchone()
-            if row:
-                return {
-                    "id": row["id"],
-                    "prompt_id": row["prompt_id"],
-                    "model_id": row["model_id"],
-                    "response_text": row["response_text"],
-                    "saved_date": row["saved_date"],
-                    "metadata": row["metadata"]
-                }
-            return None
+            return dict(row) if row else None
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting result: {e}")
+        logger.error("Error getting result: %s", e)
         raise
 
 
-def get_results_by_prompt(prompt_id: int, sort_by: str = "saved_date", order: str = "DESC") -> List[Dict[str, Any]]:
+def get_results_by_prompt(prompt_id: int, sort_by: str = "saved_date", order: str = "DESC",
+                          as_dict: bool = True) -> List[Any]:
     """
     Get all results for a specific prompt.
     
@@ -790,93 +1678,72 @@ def get_results_by_prompt(prompt_id: int, sort_by: str = "saved_date", order: st
         prompt_id [in]: ID of the prompt
         sort_by [in]: Field to sort by (default: "saved_date")
         order [in]: Sort order "ASC" or "DESC" (default: "DESC")
+        as_dict [in]: Convert rows to dictionaries; False returns sqlite3.Row
+            objects for read-only callers (default: True)
     
     Returns:
-        List[Dict[str, Any]]: List of results for the prompt
+        List[Any]: List of results for the prompt as dictionaries or sqlite3.Row objects
     """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
             
-            # Validate sort_by field
-            valid_fields = ["id", "prompt_id", "model_id", "saved_date"]
-            if sort_by not in valid_fields:
+            # Only whitelisted sort fields and orders have a statement
+            if sort_by not in _RESULTS_SORT_FIELDS:
                 sort_by = "saved_date"
-            
-            # Validate order
-            if order.upper() not in ["ASC", "DESC"]:
+            order = order.upper()
+            if order not in _SORT_ORDERS:
                 order = "DESC"
             
-            cursor.execute(f"""
-                SELECT id, prompt_id, model_id, response_text, saved_date, metadata
-                FROM results
-                WHERE prompt_id = ?
-                ORDER BY {sort_by} {order}
-            """, (prompt_id,))
+            cursor.execute(_RESULTS_BY_PROMPT_SORT_SQL[(sort_by, order)], (prompt_id,))
             
             rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "prompt_id": row["prompt_id"],
-                    "model_id": row["model_id"],
-                    "response_text": row["response_text"],
-                    "saved_date": row["saved_date"],
-                    "metadata": row["metadata"]
-                }
-                for row in rows
-            ]
+            if not as_dict:
+                return rows
+            return [dict(row) for row in rows]
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting results by prompt: {e}")
+        logger.error("Error getting results by prompt: %s", e)
         raise
 
 
-def get_all_results(sort_by: str = "saved_date", order: str = "DESC") -> List[Dict[str, Any]]:
+def get_all_results(sort_by: str = "saved_date", order: str = "DESC",
+                    as_dict: bool = True, limit: Optional[int] = None,
+                    offset: int = 0) -> List[Any]:
     """
     Get all results from the database.
     
     Args:
         sort_by [in]: Field to sort by (default: "saved_date")
         order [in]: Sort order "ASC" or "DESC" (default: "DESC")
+        as_dict [in]: Convert rows to dictionaries; False returns sqlite3.Row
+            objects for read-only callers (default: True)
+        limit [in]: Maximum number of rows to return (default: None, no limit)
+        offset [in]: Number of rows to skip (default: 0)
     
     Returns:
-        List[Dict[str, Any]]: List of results
+        List[Any]: List of results as dictionaries or sqlite3.Row objects
     """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
             
-            # Validate sort_by field
-            valid_fields = ["id", "prompt_id", "model_id", "saved_date"]
-            if sort_by not in valid_fields:
+            # Only whitelisted sort fields and orders have a statement
+            if sort_by not in _RESULTS_SORT_FIELDS:
                 sort_by = "saved_date"
-            
-            # Validate order
-            if order not in ["ASC", "DESC"]:
+            order = order.upper()
+            if order not in _SORT_ORDERS:
                 order = "DESC"
             
-            cursor.execute(f"""
-                SELECT id, prompt_id, model_id, response_text, saved_date, metadata
-                FROM results
-                ORDER BY {sort_by} {order}
-            """)
+            cursor.execute(_RESULTS_SORT_SQL[(sort_by, order)], _limit_params(limit, offset))
             
             rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "prompt_id": row["prompt_id"],
-                    "model_id": row["model_id"],
-                    "response_text": row["response_text"],
-                    "saved_date": row["saved_date"],
-                    "metadata": row["metadata"]
-                }
-                for row in rows
-            ]
+            if not as_dict:
+                return rows
+            return [dict(row) for row in rows]
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting results: {e}")
+        logger.error("Error getting results: %s", e)
         raise
 
 
@@ -897,51 +1764,54 @@ def delete_result(result_id: int) -> bool:
             
             success = cursor.rowcount > 0
             if success:
-                logger.info(f"Deleted result with ID: {result_id}")
+                logger.info("Deleted result with ID: %s", result_id)
             return success
             
     except sqlite3.Error as e:
-        logger.error(f"Error deleting result: {e}")
+        logger.error("Error deleting result: %s", e)
         raise
 
 
-def search_results(query: str) -> List[Dict[str, Any]]:
+def search_results(query: str, limit: Optional[int] = None,
+                   offset: int = 0) -> List[Dict[str, Any]]:
     """
     Search results by response text.
     
     Args:
         query [in]: Search query string
+        limit [in]: Maximum number of rows to return (default: None, no limit)
+        offset [in]: Number of rows to skip (default: 0)
     
     Returns:
         List[Dict[str, Any]]: List of matching results
     """
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(read_only=True) as conn:
             cursor = conn.cursor()
-            search_pattern = f"%{query}%"
+            phrase = _fts_phrase(query)
             
-            cursor.execute("""
-                SELECT id, prompt_id, model_id, response_text, saved_date, metadata
-                FROM results
-                WHERE response_text LIKE ?
-                ORDER BY saved_date DESC
-            """, (search_pattern,))
+            if phrase:
+                cursor.execute("""
+                    SELECT r.id, r.prompt_id, r.model_id, r.response_text, r.saved_date, r.metadata
+                    FROM results r
+                    JOIN results_fts ON results_fts.rowid = r.id
+                    WHERE results_fts MATCH ?
+                    ORDER BY r.saved_date DESC
+                    LIMIT ? OFFSET ?
+                """, (phrase, *_limit_params(limit, offset)))
+            else:
+                cursor.execute("""
+                    SELECT id, prompt_id, model_id, response_text, saved_date, metadata
+                    FROM results
+                    WHERE py_lower(response_text) LIKE ? ESCAPE '\\'
+                    ORDER BY saved_date DESC
+                    LIMIT ? OFFSET ?
+                """, (_like_pattern(query), *_limit_params(limit, offset)))
             
-            rows = cursor.fetchall()
-            return [
-                {
-                    "id": row["id"],
-                    "prompt_id": row["prompt_id"],
-                    "model_id": row["model_id"],
-                    "response_text": row["response_text"],
-                    "saved_date": row["saved_date"],
-                    "metadata": row["metadata"]
-                }
-                for row in rows
-            ]
+            return _fetch_dicts(cursor)
             
     except sqlite3.Error as e:
-        logger.error(f"Error searching results: {e}")
+        logger.error("Error searching results: %s", e)
         raise
 
 
@@ -959,14 +1829,11 @@ def get_setting(key: str) -> Optional[str]:
     """
     try:
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-            
-            row = cursor.fetchone()
+            row = conn.execute(_GET_SETTING_SQL, (key,)).fetchone()
             return row["value"] if row else None
             
     except sqlite3.Error as e:
-        logger.error(f"Error getting setting: {e}")
+        logger.error("Error getting setting: %s", e)
         raise
 
 
@@ -981,51 +1848,127 @@ def set_setting(key: str, value: str) -> bool:
     Returns:
         bool: True if set successfully, False otherwise
     """
+    # Database errors are logged once by get_db_connection and propagate
     try:
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-            current_time = datetime.now().isoformat()
-            
-            # Check if setting exists
-            cursor.execute("SELECT key FROM settings WHERE key = ?", (key,))
-            if cursor.fetchone():
-                # Update existing setting
-                cursor.execute("""
-                    UPDATE settings
-                    SET value = ?, updated_at = ?
-                    WHERE key = ?
-                """, (value, current_time, key))
-            else:
-                # Insert new setting
-                cursor.execute("""
-                    INSERT INTO settings (key, value, updated_at)
-                    VALUES (?, ?, ?)
-                """, (key, value, current_time))
+            # Insert new setting or update the existing one
+            with _transaction(conn):
+                cursor = conn.execute(_SET_SETTING_SQL, (key, value))
             
-            logger.info(f"Set setting {key} = {value}")
-            return True
+            logger.debug("Set setting %s = %s", key, value)
+            return cursor.rowcount > 0
+    finally:
+        _invalidate_settings_cache()
+
+
+def set_settings(settings: Dict[str, str]) -> int:
+    """
+    Set several setting values in a single transaction.
+    
+    Args:
+        settings [in]: Mapping of setting keys to values
+    
+    Returns:
+        int: Number of written settings
+    """
+    # Database errors are logged once by get_db_connection and propagate
+    try:
+        with get_db_connection() as conn:
+            with _transaction(conn):
+                cursor = conn.executemany(_SET_SETTING_SQL, settings.items())
             
-    except sqlite3.Error as e:
-        logger.error(f"Error setting setting: {e}")
-        raise
+            logger.debug("Set settings: %s", settings)
+            return cursor.rowcount
+    finally:
+        _invalidate_settings_cache()
+
+
+def _invalidate_settings_cache():
+    """
+    Drop cached settings so the next read reloads them from the database.
+    """
+    global _settings_cache, _settings_version
+    
+    with _settings_lock:
+        _settings_cache = None
+        _settings_version += 1
 
 
 def get_all_settings() -> Dict[str, str]:
     """
     Get all settings from the database.
+    Served from an in-memory copy until the next settings write.
     
     Returns:
         Dict[str, str]: Dictionary of all settings
     """
-    try:
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT key, value FROM settings")
-            
-            rows = cursor.fetchall()
-            return {row["key"]: row["value"] for row in rows}
-            
-    except sqlite3.Error as e:
-        logger.error(f"Error getting all settings: {e}")
-        raise
+    global _settings_cache
+    
+    with _settings_lock:
+        if _settings_cache is not None:
+            return dict(_settings_cache)
+        version = _settings_version
+    
+    # Database errors are logged once by get_db_connection and propagate
+    with get_db_connection() as conn:
+        cursor = conn.execute(_GET_ALL_SETTINGS_SQL)
+        # Plain tuples let dict() build the mapping directly from (key, value) pairs
+        cursor.row_factory = None
+        loaded = dict(cursor.fetchall())
+    
+    with _settings_lock:
+        if _settings_version == version:
+            _settings_cache = loaded
+    return dict(loaded)
+
+
+# Prompt improvement cache operations
+
+def get_improve_cache(key: str) -> Optional[str]:
+    """
+    Get a cached prompt improvement result.
+    
+    Args:
+        key [in]: Cache key
+    
+    Returns:
+        Optional[str]: Result serialized as JSON or None if not cached or expired
+    """
+    # Database errors are logged once by get_db_connection and propagate
+    with get_db_connection(read_only=True) as conn:
+        row = conn.execute(f"""
+            SELECT result_json FROM prompt_improve_cache
+            WHERE key = ? AND created_at >= {_IMPROVE_CACHE_EXPIRY_SQL}
+        """, (key,)).fetchone()
+        return row["result_json"] if row else None
+
+
+def put_improve_cache(key: str, result_json: str):
+    """
+    Store a prompt improvement result, evicting expired entries and the oldest ones over the limit.
+    
+    Args:
+        key [in]: Cache key
+        result_json [in]: Result serialized as JSON
+    """
+    # Database errors are logged once by get_db_connection and propagate
+    with get_db_connection() as conn:
+        with _transaction(conn):
+            conn.execute(f"""
+                INSERT INTO prompt_improve_cache (key, result_json, created_at)
+                VALUES (?, ?, {_NOW_SQL})
+                ON CONFLICT(key) DO UPDATE SET
+                    result_json = excluded.result_json,
+                    created_at = excluded.created_at
+            """, (key, result_json))
+            conn.execute(f"""
+                DELETE FROM prompt_improve_cache WHERE created_at < {_IMPROVE_CACHE_EXPIRY_SQL}
+            """)
+            conn.execute("""
+                DELETE FROM prompt_improve_cache WHERE key IN (
+                    SELECT key FROM prompt_improve_cache
+                    ORDER BY created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (_IMPROVE_CACHE_MAX_ENTRIES,))
 
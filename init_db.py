@@ -5,79 +5,45 @@ Creates database and adds example models.
 """
 
 import db
-import models
+
+
+# Example models for OpenRouter: (name, model_id, api_url, api_id, is_active)
+_URL = "https://openrouter.ai/api/v1/chat/completions"
+_KEY = "OPENROUTER_API_KEY"
+
+_EXAMPLE_MODELS = (
+    ("GPT-4", "openai/gpt-4", _URL, _KEY, 1),
+    ("GPT-3.5 Turbo", "openai/gpt-3.5-turbo", _URL, _KEY, 1),
+    ("Claude 3 Opus", "anthropic/claude-3-opus", _URL, _KEY, 1),
+    ("Claude 3 Sonnet", "anthropic/claude-3-sonnet", _URL, _KEY, 1),
+    ("Gemini Pro", "google/gemini-pro", _URL, _KEY, 1)
+)
 
 
 def init_example_models():
     """
     Initialize example models for OpenRouter.
     """
-    # Local variables
-    example_models = [
-        {
-            "name": "GPT-4",
-            "model_id": "openai/gpt-4",
-            "api_url": "https://openrouter.ai/api/v1/chat/completions",
-            "api_id": "OPENROUTER_API_KEY",
-            "is_active": 1
-        },
-        {
-            "name": "GPT-3.5 Turbo",
-            "model_id": "openai/gpt-3.5-turbo",
-            "api_url": "https://openrouter.ai/api/v1/chat/completions",
-            "api_id": "OPENROUTER_API_KEY",
-            "is_active": 1
-        },
-        {
-            "name": "Claude 3 Opus",
-            "model_id": "anthropic/claude-3-opus",
-            "api_url": "https://openrouter.ai/api/v1/chat/completions",
-            "api_id": "OPENROUTER_API_KEY",
-            "is_active": 1
-        },
-        {
-            "name": "Claude 3 Sonnet",
-            "model_id": "anthropic/claude-3-sonnet",
-            "api_url": "https://openrouter.ai/api/v1/chat/completions",
-            "api_id": "OPENROUTER_API_KEY",
-            "is_active": 1
-        },
-        {
-            "name": "Gemini Pro",
-            "model_id": "google/gemini-pro",
-            "api_url": "https://openrouter.ai/api/v1/chat/completions",
-            "api_id": "OPENROUTER_API_KEY",
-            "is_active": 1
-        }
-    ]
-    
-    # Check if models already exist
-    existing_models = models.get_all_models()
-    existing_names = {model.name for model in existing_models}
+    # Check which example models already exist
+    existing_names = db.get_existing_model_names([m[0] for m in _EXAMPLE_MODELS])
     
-    # Add models that don't exist
+    # Add missing models in one transaction
+    to_add = [m for m in _EXAMPLE_MODELS if m[0] not in existing_names]
     added_count = 0
-    for model_data in example_models:
-        if model_data["name"] not in existing_names:
-            try:
-                new_model = models.create_model(
-                    model_data["name"],
-                    model_data["model_id"],
-                    model_data["api_url"],
-                    model_data["api_id"],
-                    model_data["is_active"]
-                )
-                if new_model:
-                    added_count += 1
-                    print(f"Added model: {model_data['name']}")
-            except ValueError as e:
-                # Model already exists (should not happen due to check above, but handle anyway)
-                print(f"Skipped model {model_data['name']}: {e}")
-            except Exception as e:
-                print(f"Error adding model {model_data['name']}: {e}")
+    if to_add:
+        try:
+            added_count = db.create_models_bulk(to_add)
+            # INSERT OR IGNORE may skip rows, so report only names that now exist;
+            # to_add holds no previously existing names
+            added_names = db.get_existing_model_names([m[0] for m in to_add])
+            for model_data in to_add:
+                if model_data[0] in added_names:
+                    print(f"Added model: {model_data[0]}")
+        except Exception as e:
+            print(f"Error adding models: {e}")
     
     print(f"\nInitialization complete. Added {added_count} new model(s).")
-    print(f"Total models in database: {len(models.get_all_models())}")
+    print(f"Total models in database: {db.count_models()}")
 
 
 if __name__ == "__main__":
@@ -8,19 +8,26 @@ import sys
 import os
 import json
 import logging
-from typing import List, Dict, Optional, Any
+import functools
+import hashlib
+import queue
+from typing import List, Dict, Optional, Any, Iterable
 from datetime import datetime
-import markdown
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QPushButton, QTableWidget, QTableWidgetItem, QCheckBox,
     QComboBox, QLabel, QLineEdit, QMessageBox, QFileDialog, QMenuBar,
     QMenu, QStatusBar, QHeaderView, QProgressBar, QDialog, QFormLayout,
     QDialogButtonBox, QSpinBox, QAbstractItemView, QRadioButton, QButtonGroup,
-    QGroupBox, QScrollArea, QSlider
+    QGroupBox, QScrollArea, QSlider, QStyledItemDelegate, QStyle, QAbstractButton,
+    QStyleOptionButton, QToolTip, QTableView
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QIcon, QPalette
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QEvent, QRect, QAbstractTableModel,
+    QModelIndex, QPoint, QObject, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import QFont, QIcon, QPalette, QStandardItemModel, QStandardItem
 import db
 import models
 import network
@@ -32,55 +39,327 @@ import version
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent model requests in one RequestWorker
+MAX_PARALLEL_REQUESTS = 32
+
+# Maximum number of progress signals emitted by one RequestWorker run
+PROGRESS_UPDATES = 20
+
+# How long transient status bar messages stay visible, in milliseconds
+STATUS_MESSAGE_TIMEOUT = 2000
+
+# Delay after the last keystroke before search results are refiltered, in milliseconds
+SEARCH_DEBOUNCE_MS = 250
+
+# Number of prompts fetched from the database per page in ViewPromptsDialog
+PROMPTS_PAGE_SIZE = 200
+
+# Fixed results table row height, in pixels
+RESULTS_ROW_HEIGHT = 28
+
+# Maximum number of response characters shown in a results table cell
+RESPONSE_PREVIEW_CHARS = 300
+
+# Write buffer size for exported files, in bytes
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Interval between moves of finished requests into the results table, in milliseconds
+RESULTS_DRAIN_MS = 40
+
+# Maximum number of prompt characters shown in short prompt labels
+PROMPT_LABEL_CHARS = 50
+
+# Maximum number of variant characters shown in improvement variant labels
+VARIANT_LABEL_CHARS = 60
+
+# Marker appended to truncated prompt texts
+TRUNCATION_MARKER = "..."
+
+# First entry of the saved prompts combo box, selecting no prompt
+SAVED_PROMPTS_PLACEHOLDER = "-- Выберите сохраненный промт --"
+
+
+# Markdown extensions used to render model responses
+_MD_EXTENSIONS = ('extra', 'codehilite', 'nl2br', 'sane_lists')
+
+# Basic CSS applied to rendered markdown for better formatting
+_MD_CSS = """
+    body {
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+        font-size: 14px;
+        line-height: 1.6;
+        padding: 10px;
+    }
+    pre {
+        background-color: #f4f4f4;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 10px;
+        overflow-x: auto;
+    }
+    code {
+        background-color: #f4f4f4;
+        padding: 2px 4px;
+        border-radius: 3px;
+        font-family: 'Courier New', monospace;
+    }
+    pre code {
+        background-color: transparent;
+        padding: 0;
+    }
+    h1, h2, h3, h4, h5, h6 {
+        margin-top: 1em;
+        margin-bottom: 0.5em;
+    }
+    blockquote {
+        border-left: 4px solid #ddd;
+        margin-left: 0;
+        padding-left: 1em;
+        color: #666;
+    }
+    table {
+        border-collapse: collapse;
+        width: 100%;
+    }
+    th, td {
+        border: 1px solid #ddd;
+        padding: 8px;
+        text-align: left;
+    }
+    th {
+        background-color: #f2f2f2;
+    }
+"""
+
+# HTML document template for rendered markdown
+_MD_TEMPLATE = "<style>{css}</style>\n{body}"
+
+
+@functools.lru_cache(maxsize=128)
+def _render_markdown(text: str) -> str:
+    """
+    Convert markdown text to styled HTML, caching recent conversions.
+    
+    Args:
+        text [in]: Markdown text
+    
+    Returns:
+        Rendered HTML document with the markdown CSS applied
+    """
+    # Imported lazily: markdown and its extensions are only needed once a dialog opens
+    import markdown
+    
+    # Local variables
+    body = markdown.markdown(text, extensions=list(_MD_EXTENSIONS))
+    
+    return _MD_TEMPLATE.format(css=_MD_CSS, body=body)
+
+
+def _response_preview(text: str) -> str:
+    """
+    Build single-line preview of a response for a table cell.
+    
+    Args:
+        text [in]: Full response text
+    
+    Returns:
+        str: Leading part of the text with whitespace runs and newlines collapsed
+    """
+    return " ".join(text[:RESPONSE_PREVIEW_CHARS].split())
+
+
+def _prompt_label(text: str) -> str:
+    """
+    Build short prompt label for combo boxes and confirmations.
+    
+    Args:
+        text [in]: Prompt text
+    
+    Returns:
+        str: First PROMPT_LABEL_CHARS characters, marked when truncated
+    """
+    if len(text) > PROMPT_LABEL_CHARS:
+        return text[:PROMPT_LABEL_CHARS] + TRUNCATION_MARKER
+    return text
+
 
 class RequestWorker(QThread):
     """
     Worker thread for sending API requests.
+    Results are put into a queue drained by the GUI thread at its own pace.
     """
     
-    finished = pyqtSignal(int, str, str, str)  # model_id, model_name, api_id, response/error
     progress = pyqtSignal(int, int)  # current, total
     
-    def __init__(self, model_list: List[models.Model], prompt: str, 
-                 timeout: int = 30, max_retries: int = 3):
+    def __init__(self, model_list: List[models.Model], prompt: str,
+                 result_queue: queue.Queue, timeout: int = 30, max_retries: int = 3):
         """
         Initialize worker thread.
         
         Args:
             model_list [in]: List of models to query
             prompt [in]: Prompt text
+            result_queue [in]: Queue receiving one result dict per model
             timeout [in]: Request timeout
             max_retries [in]: Maximum retry attempts
         """
         super().__init__()
         self.model_list = model_list
         self.prompt = prompt
+        self.result_queue = result_queue
         self.timeout = timeout
         self.max_retries = max_retries
+        # Shared keep-alive session, sized for the concurrent fan-out
+        self.session = network.create_session(MAX_PARALLEL_REQUESTS)
     
     def run(self):
         """
         Execute requests in thread.
+        Requests to all models run concurrently; results are queued
+        in completion order.
         """
         total = len(self.model_list)
-        for idx, model in enumerate(self.model_list):
+        if total == 0:
+            return
+        
+        # Coalesce progress updates to at most PROGRESS_UPDATES signals per run
+        step = max(1, total // PROGRESS_UPDATES)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(total, MAX_PARALLEL_REQUESTS)) as executor:
+                futures = {
+                    executor.submit(self._query_model, model): model
+                    for model in self.model_list
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    model = futures[future]
+                    self.result_queue.put({
+                        "model_id": model.id,
+                        "model_name": model.name,
+                        "api_id": model.api_id,
+                        "response": future.result(),
+                        "selected": False
+                    })
+                    if done % step == 0 or done == total:
+                        self.progress.emit(done, total)
+        finally:
+            self.session.close()
+    
+    def _query_model(self, model: models.Model) -> str:
+        """
+        Send prompt to a single model.
+        
+        Args:
+            model [in]: Model to query
+        
+        Returns:
+            str: Response text or formatted error message
+        """
+        try:
+            return network.send_prompt_to_model(
+                model, self.prompt, self.timeout, self.max_retries,
+                session=self.session
+            )
+        except network.APIError as e:
+            # API-specific error (message already formatted)
+            return str(e)
+        except ValueError as e:
+            # Configuration error (e.g., missing API key)
+            return f"Ошибка конфигурации: {str(e)}"
+        except Exception as e:
+            # Other errors
+            error_msg = str(e) if str(e) else type(e).__name__
+            return f"Ошибка: {error_msg}"
+
+
+class ImproveWorker(QThread):
+    """
+    Worker thread for improving a prompt without blocking the GUI.
+    """
+    
+    done = pyqtSignal(dict)  # improve_with_variants() result
+    error = pyqtSignal(str)  # error message
+    
+    def __init__(self, improver: prompt_improver.PromptImprover, prompt: str,
+                 model: models.Model, adaptation_type: Optional[str] = None,
+                 cache_key: Optional[str] = None):
+        """
+        Initialize worker thread.
+        
+        Args:
+            improver [in]: PromptImprover instance
+            prompt [in]: Prompt text to improve
+            model [in]: Model to use for improvement
+            adaptation_type [in]: Optional adaptation type
+            cache_key [in]: Key to store the result under in the improvement cache
+        """
+        super().__init__()
+        self.improver = improver
+        self.prompt = prompt
+        self.model = model
+        self.adaptation_type = adaptation_type
+        self.cache_key = cache_key
+    
+    def run(self):
+        """
+        Execute improvement request in thread.
+        """
+        try:
+            result = self.improver.improve_with_variants(
+                self.prompt, self.model, self.adaptation_type
+            )
+        except Exception as e:
+            self.error.emit(str(e) if str(e) else type(e).__name__)
+            return
+        
+        if self.cache_key:
             try:
-                response = network.send_prompt_to_model(
-                    model, self.prompt, self.timeout, self.max_retries
-                )
-                self.finished.emit(model.id, model.name, model.api_id, response)
-            except network.APIError as e:
-                # API-specific error (message already formatted)
-                self.finished.emit(model.id, model.name, model.api_id, str(e))
-            except ValueError as e:
-                # Configuration error (e.g., missing API key)
-                self.finished.emit(model.id, model.name, model.api_id, f"Ошибка конфигурации: {str(e)}")
+                db.put_improve_cache(self.cache_key, json.dumps(result, ensure_ascii=False))
             except Exception as e:
-                # Other errors
-                error_msg = str(e) if str(e) else type(e).__name__
-                self.finished.emit(model.id, model.name, model.api_id, f"Ошибка: {error_msg}")
-            
-            self.progress.emit(idx + 1, total)
+                logger.warning(f"Error caching improvement result: {e}")
+        
+        self.done.emit(result)
+
+
+class DBRunnable(QRunnable):
+    """
+    Runnable executing a database call in the global thread pool.
+    The result is delivered to the GUI thread through its signals.
+    """
+    
+    class Signals(QObject):
+        """
+        Signals emitted by DBRunnable.
+        """
+        finished = pyqtSignal(object)
+        error = pyqtSignal(str)
+    
+    def __init__(self, func, *args, **kwargs):
+        """
+        Initialize database runnable.
+        
+        Args:
+            func [in]: Callable performing the database work
+            args [in]: Positional arguments for func
+            kwargs [in]: Keyword arguments for func
+        """
+        super().__init__()
+        # Created in the calling (GUI) thread, so connected slots run there
+        self.signals = DBRunnable.Signals()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+    
+    def run(self):
+        """
+        Execute the database call in a pool thread.
+        """
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e) if str(e) else type(e).__name__)
+            return
+        self.signals.finished.emit(result)
 
 
 class ModelDialog(QDialog):
@@ -169,6 +448,118 @@ class ModelDialog(QDialog):
         }
 
 
+class ModelActionsDelegate(QStyledItemDelegate):
+    """
+    Delegate painting edit/delete buttons in a table cell without per-row widgets.
+    """
+    
+    actionRequested = pyqtSignal(int, str)  # row, action ("edit" or "delete")
+    
+    # (action, icon, tooltip) for each painted button
+    ACTIONS = (
+        ("edit", "✏", "Редактировать"),
+        ("delete", "🗑", "Удалить"),
+    )
+    BUTTON_WIDTH = 30
+    MARGIN = 2
+    
+    def _button_rects(self, cell_rect: QRect) -> List[QRect]:
+        """
+        Compute button rectangles inside a cell.
+        
+        Args:
+            cell_rect [in]: Cell rectangle
+        
+        Returns:
+            List[QRect]: One rectangle per action, in ACTIONS order
+        """
+        # Local variables
+        height = cell_rect.height() - 2 * self.MARGIN
+        rects = []
+        
+        for i in range(len(self.ACTIONS)):
+            left = cell_rect.left() + self.MARGIN + i * (self.BUTTON_WIDTH + self.MARGIN)
+            rects.append(QRect(left, cell_rect.top() + self.MARGIN, self.BUTTON_WIDTH, height))
+        return rects
+    
+    def _action_at(self, cell_rect: QRect, pos) -> Optional[int]:
+        """
+        Find the action button under a position.
+        
+        Args:
+            cell_rect [in]: Cell rectangle
+            pos [in]: Position in view coordinates
+        
+        Returns:
+            Optional[int]: Index into ACTIONS or None
+        """
+        for i, rect in enumerate(self._button_rects(cell_rect)):
+            if rect.contains(pos):
+                return i
+        return None
+    
+    def paint(self, painter, option, index):
+        """
+        Paint cell background and action buttons.
+        """
+        super().paint(painter, option, index)
+        
+        # Local variables
+        style = option.widget.style() if option.widget else QApplication.style()
+        
+        for (_, icon, _), rect in zip(self.ACTIONS, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = icon
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button, painter)
+    
+    def sizeHint(self, option, index):
+        """
+        Return size fitting all action buttons.
+        """
+        # Local variables
+        hint = super().sizeHint(option, index)
+        
+        hint.setWidth(len(self.ACTIONS) * (self.BUTTON_WIDTH + self.MARGIN) + self.MARGIN)
+        return hint
+    
+    def editorEvent(self, event, model, option, index):
+        """
+        Emit actionRequested when a button is clicked.
+        """
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action_index = self._action_at(option.rect, event.pos())
+            if action_index is not None:
+                self.actionRequested.emit(index.row(), self.ACTIONS[action_index][0])
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(self, event, view, option, index):
+        """
+        Show tooltip for the button under the cursor.
+        """
+        # Local variables
+        action_index = self._action_at(option.rect, event.pos())
+        
+        if action_index is None:
+            QToolTip.hideText()
+            return False
+        QToolTip.showText(event.globalPos(), self.ACTIONS[action_index][2], view)
+        return True
+
+
+class ResultActionsDelegate(ModelActionsDelegate):
+    """
+    Delegate painting the open button of a results table row without per-row widgets.
+    """
+    
+    ACTIONS = (
+        ("open", "Открыть", "Открыть ответ"),
+    )
+    BUTTON_WIDTH = 80
+
+
 class ManageModelsDialog(QDialog):
     """
     Dialog for managing models (view, edit, delete, enable/disable).
@@ -182,6 +573,8 @@ class ManageModelsDialog(QDialog):
             parent [in]: Parent widget
         """
         super().__init__(parent)
+        self.row_models = []
+        self.row_by_id = {}
         self.init_ui()
         self.load_models()
     
@@ -218,6 +611,11 @@ class ManageModelsDialog(QDialog):
         self.models_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.models_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
+        # Edit/delete buttons are painted by a delegate instead of per-row widgets
+        self.actions_delegate = ModelActionsDelegate(self.models_table)
+        self.actions_delegate.actionRequested.connect(self.on_model_action, Qt.QueuedConnection)
+        self.models_table.setItemDelegateForColumn(5, self.actions_delegate)
+        
         layout.addWidget(self.models_table)
         
         # Buttons
@@ -246,6 +644,12 @@ class ManageModelsDialog(QDialog):
         buttons_layout.addWidget(close_button)
         
         layout.addLayout(buttons_layout)
+        
+        # Status bar for non-blocking success messages
+        self.status_bar = QStatusBar()
+        self.status_bar.setSizeGripEnabled(False)
+        layout.addWidget(self.status_bar)
+        
         self.setLayout(layout)
         
         # Setup window
@@ -259,58 +663,101 @@ class ManageModelsDialog(QDialog):
         try:
             # Local variables
             all_models = models.get_all_models()
-            self.models_table.setRowCount(len(all_models))
+            self.row_models = all_models
+            self.row_by_id = {model.id: row for row, model in enumerate(all_models)}
+            sorting_enabled = self.models_table.isSortingEnabled()
             
-            for row, model in enumerate(all_models):
-                # Name
-                name_item = QTableWidgetItem(model.name)
-                name_item.setData(Qt.UserRole, model.id)
-                self.models_table.setItem(row, 0, name_item)
-                
-                # Model ID
-                model_id_item = QTableWidgetItem(model.model_id)
-                self.models_table.setItem(row, 1, model_id_item)
-                
-                # API URL
-                url_item = QTableWidgetItem(model.api_url)
-                self.models_table.setItem(row, 2, url_item)
-                
-                # API ID
-                api_id_item = QTableWidgetItem(model.api_id)
-                self.models_table.setItem(row, 3, api_id_item)
-                
-                # Active checkbox
-                active_checkbox = QCheckBox()
-                active_checkbox.setChecked(model.is_active == 1)
-                active_checkbox.setEnabled(False)  # Disable direct editing
-                self.models_table.setCellWidget(row, 4, active_checkbox)
-                
-                # Actions buttons
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout()
-                actions_layout.setContentsMargins(2, 2, 2, 2)
-                
-                edit_btn = QPushButton("✏")
-                edit_btn.setMaximumWidth(30)
-                edit_btn.setToolTip("Редактировать")
-                edit_btn.clicked.connect(lambda checked, m=model: self.edit_model(m))
-                
-                delete_btn = QPushButton("🗑")
-                delete_btn.setMaximumWidth(30)
-                delete_btn.setToolTip("Удалить")
-                delete_btn.clicked.connect(lambda checked, m=model: self.delete_model(m))
-                
-                actions_layout.addWidget(edit_btn)
-                actions_layout.addWidget(delete_btn)
-                actions_layout.addStretch()
+            # Build all cell items before touching the table
+            row_items = [self.create_row_items(model) for model in all_models]
+            
+            # Suspend repaints and signals while the table is rebuilt
+            self.models_table.setUpdatesEnabled(False)
+            self.models_table.setSortingEnabled(False)
+            self.models_table.blockSignals(True)
+            try:
+                self.models_table.setRowCount(0)
+                self.models_table.setRowCount(len(all_models))
                 
-                actions_widget.setLayout(actions_layout)
-                self.models_table.setCellWidget(row, 5, actions_widget)
+                for row, items in enumerate(row_items):
+                    for col, item in enumerate(items):
+                        if item is not None:
+                            self.models_table.setItem(row, col, item)
+            finally:
+                self.models_table.blockSignals(False)
+                self.models_table.setSortingEnabled(sorting_enabled)
+                self.models_table.setUpdatesEnabled(True)
                 
         except Exception as e:
             logger.error(f"Error loading models: {e}")
             QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки моделей: {str(e)}")
     
+    def update_model_row(self, model_id: int):
+        """
+        Refresh a single model row in place, falling back to a full reload.
+        
+        Args:
+            model_id [in]: ID of the changed model
+        """
+        # Local variables
+        row = self.row_by_id.get(model_id)
+        model = models.load_model_config(model_id)
+        
+        if row is None or model is None:
+            self.load_models()
+            return
+        
+        self.row_models[row] = model
+        for col, item in enumerate(self.create_row_items(model)):
+            if item is None:
+                self.models_table.takeItem(row, col)
+            else:
+                self.models_table.setItem(row, col, item)
+    
+    def create_row_items(self, model: models.Model) -> List[Optional[QTableWidgetItem]]:
+        """
+        Create table cell items for a model row.
+        
+        Args:
+            model [in]: Model to display
+        
+        Returns:
+            List[Optional[QTableWidgetItem]]: Items for columns 0-4 (None for empty text cells)
+        """
+        # Local variables
+        name_item = QTableWidgetItem(model.name)
+        active_item = QTableWidgetItem()
+        
+        name_item.setData(Qt.UserRole, model.id)
+        
+        # Active flag (read-only check indicator)
+        active_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        active_item.setCheckState(Qt.Checked if model.is_active == 1 else Qt.Unchecked)
+        
+        return [
+            name_item,
+            QTableWidgetItem(model.model_id) if model.model_id else None,
+            QTableWidgetItem(model.api_url) if model.api_url else None,
+            QTableWidgetItem(model.api_id) if model.api_id else None,
+            active_item
+        ]
+    
+    @pyqtSlot(int, str)
+    def on_model_action(self, row: int, action: str):
+        """
+        Handle edit/delete button click from the actions column.
+        
+        Args:
+            row [in]: Table row
+            action [in]: "edit" or "delete"
+        """
+        if row < 0 or row >= len(self.row_models):
+            return
+        
+        if action == "edit":
+            self.edit_model(self.row_models[row])
+        elif action == "delete":
+            self.delete_model(self.row_models[row])
+    
     def get_selected_model_id(self) -> Optional[int]:
         """
         Get selected model ID from table.
@@ -329,6 +776,7 @@ class ManageModelsDialog(QDialog):
             return name_item.data(Qt.UserRole)
         return None
     
+    @pyqtSlot()
     def add_model(self):
         """
         Add new model.
@@ -347,11 +795,12 @@ class ManageModelsDialog(QDialog):
                 data["name"], data["model_id"], data["api_url"], data["api_id"], data["is_active"]
             )
             if new_model:
-                QMessageBox.information(self, "Успех", "Модель успешно добавлена")
+                self.status_bar.showMessage("Модель успешно добавлена", STATUS_MESSAGE_TIMEOUT)
                 self.load_models()
             else:
                 QMessageBox.critical(self, "Ошибка", "Не удалось добавить модель")
     
+    @pyqtSlot()
     def edit_selected_model(self):
         """
         Edit selected model.
@@ -392,11 +841,12 @@ class ManageModelsDialog(QDialog):
                 data["api_id"], data["is_active"]
             )
             if success:
-                QMessageBox.information(self, "Успех", "Модель успешно обновлена")
-                self.load_models()
+                self.status_bar.showMessage("Модель успешно обновлена", STATUS_MESSAGE_TIMEOUT)
+                self.update_model_row(model.id)
             else:
                 QMessageBox.critical(self, "Ошибка", "Не удалось обновить модель")
     
+    @pyqtSlot()
     def delete_selected_model(self):
         """
         Delete selected model.
@@ -432,11 +882,12 @@ class ManageModelsDialog(QDialog):
         if reply == QMessageBox.Yes:
             success = models.delete_model(model.id)
             if success:
-                QMessageBox.information(self, "Успех", "Модель успешно удалена")
+                self.status_bar.showMessage("Модель успешно удалена", STATUS_MESSAGE_TIMEOUT)
                 self.load_models()
             else:
                 QMessageBox.critical(self, "Ошибка", "Не удалось удалить модель")
     
+    @pyqtSlot()
     def toggle_active(self):
         """
         Toggle active status of selected model.
@@ -459,8 +910,8 @@ class ManageModelsDialog(QDialog):
         
         if success:
             status_text = "включена" if (new_active == 1) else "отключена"
-            QMessageBox.information(self, "Успех", f"Модель {status_text}")
-            self.load_models()
+            self.status_bar.showMessage(f"Модель {status_text}", STATUS_MESSAGE_TIMEOUT)
+            self.update_model_row(model.id)
         else:
             QMessageBox.critical(self, "Ошибка", "Не удалось изменить статус модели")
 
@@ -492,62 +943,7 @@ class MarkdownViewDialog(QDialog):
         
         # Convert markdown to HTML and display
         try:
-            html = markdown.markdown(
-                text,
-                extensions=['extra', 'codehilite', 'nl2br', 'sane_lists']
-            )
-            # Add basic CSS for better formatting
-            html = f"""
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                    font-size: 14px;
-                    line-height: 1.6;
-                    padding: 10px;
-                }}
-                pre {{
-                    background-color: #f4f4f4;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    padding: 10px;
-                    overflow-x: auto;
-                }}
-                code {{
-                    background-color: #f4f4f4;
-                    padding: 2px 4px;
-                    border-radius: 3px;
-                    font-family: 'Courier New', monospace;
-                }}
-                pre code {{
-                    background-color: transparent;
-                    padding: 0;
-                }}
-                h1, h2, h3, h4, h5, h6 {{
-                    margin-top: 1em;
-                    margin-bottom: 0.5em;
-                }}
-                blockquote {{
-                    border-left: 4px solid #ddd;
-                    margin-left: 0;
-                    padding-left: 1em;
-                    color: #666;
-                }}
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                }}
-                th, td {{
-                    border: 1px solid #ddd;
-                    padding: 8px;
-                    text-align: left;
-                }}
-                th {{
-                    background-color: #f2f2f2;
-                }}
-            </style>
-            {html}
-            """
-            self.text_edit.setHtml(html)
+            self.text_edit.setHtml(_render_markdown(text))
         except Exception as e:
             # Fallback to plain text if markdown conversion fails
             logging.error(f"Error converting markdown: {e}")
@@ -774,6 +1170,8 @@ class PromptImprovementDialog(QDialog):
         self.original_prompt = original_prompt
         self.improver = improver
         self.selected_prompt = None
+        self.improve_worker = None
+        self.num_variants = 3
         self.init_ui()
     
     def init_ui(self):
@@ -831,6 +1229,11 @@ class PromptImprovementDialog(QDialog):
         adaptation_layout.addWidget(self.adaptation_combo)
         layout.addLayout(adaptation_layout)
         
+        # Cached results are reused unless the user asks for a fresh answer
+        self.ignore_cache_checkbox = QCheckBox("Игнорировать кэш")
+        self.ignore_cache_checkbox.setToolTip("Запросить модель заново, даже если результат уже сохранён")
+        layout.addWidget(self.ignore_cache_checkbox)
+        
         # Progress indicator
         self.progress_label = QLabel("")
         self.progress_label.setVisible(False)
@@ -853,7 +1256,9 @@ class PromptImprovementDialog(QDialog):
         results_layout.addWidget(variants_label)
         
         # Radio buttons for variants
-        self.variants_group = QButtonGroup()
+        self.variants_group = QButtonGroup(self)
+        # One connection for all radios; the group reports which one toggled
+        self.variants_group.buttonToggled.connect(self.on_variant_selected)
         self.variants_layout = QVBoxLayout()
         self.variant_radios = []
         
@@ -893,6 +1298,7 @@ class PromptImprovementDialog(QDialog):
         self.setWindowTitle("Улучшение промта")
         self.setMinimumSize(700, 600)
     
+    @pyqtSlot()
     def improve_prompt(self):
         """
         Improve prompt using AI.
@@ -913,107 +1319,449 @@ class PromptImprovementDialog(QDialog):
         self.progress_label.setVisible(True)
         self.setEnabled(False)
         
-        try:
-            # Get adaptation type
-            adaptation_type = self.adaptation_combo.currentData()
-            
-            # Get number of variants from parent settings if available
-            num_variants = 3  # Default
-            if self.parent() and hasattr(self.parent(), 'improvement_num_variants'):
-                num_variants = self.parent().improvement_num_variants
-            
-            # Improve prompt with variants
-            result = self.improver.improve_with_variants(
-                self.original_prompt, current_model_data, adaptation_type
-            )
-            
-            # Limit variants to configured number
-            if "variants" in result:
-                result["variants"] = result["variants"][:num_variants]
-            
-            # Display improved version
-            improved_text = result.get("improved", "")
-            if improved_text:
-                self.improved_text.setPlainText(improved_text)
-                # Set improved as default selection
-                self.selected_prompt = improved_text
-            else:
-                self.improved_text.setPlainText("Не удалось получить улучшенную версию")
-            
-            # Display variants
-            variants = result.get("variants", [])
-            for i, radio in enumerate(self.variant_radios):
-                if i < len(variants):
-                    # Truncate for display
-                    display_text = variants[i]
-                    if len(display_text) > 60:
-                        display_text = display_text[:60] + "..."
-                    radio.setText(f"Вариант {i + 1}: {display_text}")
-                    radio.setVisible(True)
-                    # Store full variant text
-                    radio.setProperty("variant_text", variants[i])
-                    # Connect signal to update selection
-                    radio.toggled.connect(self.on_variant_selected)
-                else:
-                    radio.setVisible(False)
-            
-            # If no improved version but have variants, select first variant
-            if not improved_text and variants:
-                self.variant_radios[0].setChecked(True)
-                self.selected_prompt = variants[0]
-            
-            self.progress_label.setText("Готово")
-            
-        except Exception as e:
-            logger.error(f"Error improving prompt: {e}")
-            error_msg = str(e) if str(e) else type(e).__name__
-            QMessageBox.critical(
-                self, "Ошибка",
-                f"Ошибка при улучшении промта: {error_msg}"
-            )
-            self.progress_label.setVisible(False)
-        finally:
-            self.setEnabled(True)
-            # Hide progress after a delay
-            QTimer.singleShot(2000, lambda: self.progress_label.setVisible(False))
+        # Get number of variants from parent settings if available
+        self.num_variants = 3  # Default
+        if self.parent() and hasattr(self.parent(), 'improvement_num_variants'):
+            self.num_variants = self.parent().improvement_num_variants
+        
+        # Reuse a cached result for the same prompt, model and adaptation type
+        adaptation_type = self.adaptation_combo.currentData()
+        cache_key = hashlib.sha1(
+            f"{current_model_data.id}:{adaptation_type}:{self.original_prompt}".encode()
+        ).hexdigest()
+        cached = None
+        if not self.ignore_cache_checkbox.isChecked():
+            try:
+                cached = db.get_improve_cache(cache_key)
+            except Exception as e:
+                logger.warning(f"Error reading improvement cache: {e}")
+        if cached:
+            self.on_improve_done(json.loads(cached))
+            return
+        
+        # Improve prompt with variants in background thread
+        self.improve_worker = ImproveWorker(
+            self.improver, self.original_prompt, current_model_data,
+            adaptation_type, cache_key
+        )
+        self.improve_worker.done.connect(self.on_improve_done)
+        self.improve_worker.error.connect(self.on_improve_error)
+        self.improve_worker.start()
+    
+    @pyqtSlot(dict)
+    def on_improve_done(self, result: Dict[str, Any]):
+        """
+        Display improvement result.
+        
+        Args:
+            result [in]: Dictionary with improved prompt and variants
+        """
+        # Limit variants to configured number
+        if "variants" in result:
+            result["variants"] = result["variants"][:self.num_variants]
+        
+        # Display improved version
+        improved_text = result.get("improved", "")
+        if improved_text:
+            self.improved_text.setPlainText(improved_text)
+            # Set improved as default selection
+            self.selected_prompt = improved_text
+        else:
+            self.improved_text.setPlainText("Не удалось получить улучшенную версию")
+        
+        # Display variants
+        variants = result.get("variants", [])
+        for i, radio in enumerate(self.variant_radios):
+            if i < len(variants):
+                # Truncate for display
+                display_text = variants[i]
+                if len(display_text) > VARIANT_LABEL_CHARS:
+                    display_text = display_text[:VARIANT_LABEL_CHARS] + TRUNCATION_MARKER
+                radio.setText(f"Вариант {i + 1}: {display_text}")
+                radio.setVisible(True)
+                # Store full variant text
+                radio.setProperty("variant_text", variants[i])
+            else:
+                radio.setVisible(False)
+        
+        # If no improved version but have variants, select first variant
+        if not improved_text and variants:
+            self.variant_radios[0].setChecked(True)
+            self.selected_prompt = variants[0]
+        
+        self.progress_label.setText("Готово")
+        self.finish_improvement()
+    
+    @pyqtSlot(str)
+    def on_improve_error(self, error_msg: str):
+        """
+        Report improvement error.
+        
+        Args:
+            error_msg [in]: Error message
+        """
+        logger.error(f"Error improving prompt: {error_msg}")
+        QMessageBox.critical(
+            self, "Ошибка",
+            f"Ошибка при улучшении промта: {error_msg}"
+        )
+        self.progress_label.setVisible(False)
+        self.finish_improvement()
+    
+    def finish_improvement(self):
+        """
+        Re-enable dialog after improvement request completes.
+        """
+        self.setEnabled(True)
+        # Hide progress after a delay
+        QTimer.singleShot(2000, lambda: self.progress_label.setVisible(False))
+    
+    def reject(self):
+        """
+        Close dialog unless an improvement request is still running.
+        """
+        if self.improve_worker and self.improve_worker.isRunning():
+            return
+        super().reject()
+    
+    @pyqtSlot(QAbstractButton, bool)
+    def on_variant_selected(self, button: QAbstractButton, checked: bool):
+        """
+        Handle variant selection.
+        
+        Args:
+            button [in]: Radio button that was toggled
+            checked [in]: Whether radio button is checked
+        """
+        if checked:
+            variant_text = button.property("variant_text")
+            if variant_text:
+                self.selected_prompt = variant_text
+    
+    def get_selected_prompt(self) -> Optional[str]:
+        """
+        Get selected prompt variant.
+        
+        Returns:
+            Optional[str]: Selected prompt text or None
+        """
+        # Check if any variant is selected via radio button
+        radio = self.variants_group.checkedButton()
+        if radio is not None and radio.isVisible():
+            variant_text = radio.property("variant_text")
+            if variant_text:
+                return variant_text
+        
+        # If no variant selected, return improved version
+        improved = self.improved_text.toPlainText().strip()
+        if improved and improved != "Не удалось получить улучшенную версию":
+            return improved
+        
+        # Fallback to original
+        return self.original_prompt if self.original_prompt.strip() else None
+
+
+class PromptsModel(QAbstractTableModel):
+    """
+    Table model exposing saved prompts page by page.
+    Filtering, sorting and paging are done by SQLite; rows are fetched as the view scrolls.
+    """
+    
+    HEADERS = ("Дата", "Промт", "Теги")
+    SORT_FIELDS = ("date", "prompt", "tags")  # Database field for each column
+    
+    def __init__(self, parent=None):
+        """
+        Initialize prompts model.
+        
+        Args:
+            parent [in]: Parent object
+        """
+        super().__init__(parent)
+        self.prompts = []
+        self.query = ""
+        self.sort_by = "date"
+        self.order = "DESC"
+        self.has_more = False
+        self.full_texts = {}  # Prompt id -> full text, loaded on tooltip hover
+    
+    def fetch_page(self, offset: int) -> List[Any]:
+        """
+        Fetch one page of prompts matching the current query and sort.
+        
+        Args:
+            offset [in]: Number of rows to skip
+        
+        Returns:
+            List[Any]: Prompt rows with id, date, prompt_head, prompt_len and tags fields
+        """
+        return db.get_prompts_summary(
+            self.query, PROMPTS_PAGE_SIZE, offset, self.sort_by, self.order,
+            split_terms=True
+        )
+    
+    def full_text(self, prompt: Dict[str, Any]) -> str:
+        """
+        Get full prompt text, loading it from the database only when it was truncated.
+        
+        Args:
+            prompt [in]: Prompt summary row
+        
+        Returns:
+            str: Full prompt text
+        """
+        if prompt["prompt_len"] <= db.PROMPT_HEAD_LENGTH:
+            return prompt["prompt_head"]
+        
+        if prompt["id"] not in self.full_texts:
+            full = db.get_prompt(prompt["id"])
+            self.full_texts[prompt["id"]] = full["prompt"] if full else prompt["prompt_head"]
+        return self.full_texts[prompt["id"]]
+    
+    def reload(self):
+        """
+        Reload the first page of prompts.
+        """
+        # Local variables
+        prompts = self.fetch_page(0)
+        
+        self.beginResetModel()
+        self.prompts = prompts
+        self.full_texts = {}
+        self.has_more = len(prompts) == PROMPTS_PAGE_SIZE
+        self.endResetModel()
+    
+    def set_query(self, query: str):
+        """
+        Set search query and reload matching prompts.
+        
+        Args:
+            query [in]: Search text matched against prompt text and tags
+        """
+        # Local variables
+        query = query.strip()
+        
+        # A narrower query cannot match anything when the previous one matched nothing
+        if not self.prompts and not self.has_more and db.narrows_search(self.query, query):
+            self.query = query
+            return
+        
+        self.query = query
+        self.reload()
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """
+        Return True while more pages are available.
+        """
+        return not parent.isValid() and self.has_more
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        Append the next page of prompts.
+        """
+        try:
+            prompts = self.fetch_page(len(self.prompts))
+        except Exception as e:
+            logger.error(f"Error fetching prompts: {e}")
+            self.has_more = False
+            return
+        
+        self.has_more = len(prompts) == PROMPTS_PAGE_SIZE
+        if not prompts:
+            return
+        
+        self.beginInsertRows(QModelIndex(), len(self.prompts), len(self.prompts) + len(prompts) - 1)
+        self.prompts.extend(prompts)
+        self.endInsertRows()
+    
+    def sort(self, column: int, order: int = Qt.AscendingOrder):
+        """
+        Sort prompts by column in the database.
+        """
+        # Local variables
+        sort_by = self.SORT_FIELDS[column] if 0 <= column < len(self.SORT_FIELDS) else "date"
+        sort_order = "ASC" if order == Qt.AscendingOrder else "DESC"
+        
+        if (sort_by, sort_order) == (self.sort_by, self.order):
+            return
+        
+        self.sort_by = sort_by
+        self.order = sort_order
+        try:
+            self.reload()
+        except Exception as e:
+            logger.error(f"Error sorting prompts: {e}")
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Return number of loaded prompts.
+        """
+        return 0 if parent.isValid() else len(self.prompts)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """
+        Return number of columns.
+        """
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Return cell data for the given role.
+        """
+        if not index.isValid():
+            return None
+        
+        # Local variables
+        prompt = self.prompts[index.row()]
+        column = index.column()
+        
+        if role == Qt.UserRole:
+            return prompt["id"]
+        
+        if column == 0:
+            if role == Qt.DisplayRole:
+                return prompt["date"][:10]
+        elif column == 1:
+            if role == Qt.DisplayRole:
+                # Truncated for display
+                if prompt["prompt_len"] > db.PROMPT_HEAD_LENGTH:
+                    return prompt["prompt_head"][:db.PROMPT_HEAD_LENGTH] + TRUNCATION_MARKER
+                return prompt["prompt_head"]
+            if role == Qt.ToolTipRole:
+                try:
+                    return self.full_text(prompt)  # Full text in tooltip
+                except Exception as e:
+                    logger.error(f"Error loading prompt text: {e}")
+                    return prompt["prompt_head"]
+        elif column == 2:
+            if role == Qt.DisplayRole:
+                return prompt["tags"] or ""
+        return None
+    
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole):
+        """
+        Return header labels.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ResultsModel(QAbstractTableModel):
+    """
+    Table model exposing request results stored in a list of result dicts.
+    The selection checkbox state is kept in each result's "selected" field.
+    """
+    
+    HEADERS = ("Выбрать", "Модель", "Ответ", "Действия")
+    
+    def __init__(self, results: List[Dict[str, Any]], parent=None):
+        """
+        Initialize results model.
+        
+        Args:
+            results [in]: Result dicts shared with the owner, modified in place
+            parent [in]: Parent object
+        """
+        super().__init__(parent)
+        self.results = results
+    
+    def append_results(self, results: List[Dict[str, Any]]):
+        """
+        Append result rows with a single insert notification.
+        
+        Args:
+            results [in]: Result dicts with model_name, response and selected fields
+        """
+        if not results:
+            return
+        
+        # Local variables
+        first = len(self.results)
+        
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self.results.extend(results)
+        self.endInsertRows()
     
-    def on_variant_selected(self, checked: bool):
+    def replace_results(self, results: List[Dict[str, Any]]):
         """
-        Handle variant selection.
+        Replace all rows with new results.
         
         Args:
-            checked [in]: Whether radio button is checked
+            results [in]: New result dicts
         """
-        if checked:
-            # Find which radio was checked
-            for radio in self.variant_radios:
-                if radio.isChecked():
-                    variant_text = radio.property("variant_text")
-                    if variant_text:
-                        self.selected_prompt = variant_text
-                    break
+        self.beginResetModel()
+        self.results[:] = results
+        self.endResetModel()
     
-    def get_selected_prompt(self) -> Optional[str]:
+    def rowCount(self, parent=QModelIndex()) -> int:
         """
-        Get selected prompt variant.
+        Return number of results.
+        """
+        return 0 if parent.isValid() else len(self.results)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """
+        Return number of columns.
+        """
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Return cell data for the given role.
+        """
+        if not index.isValid():
+            return None
         
-        Returns:
-            Optional[str]: Selected prompt text or None
+        # Local variables
+        result = self.results[index.row()]
+        column = index.column()
+        
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if result["selected"] else Qt.Unchecked
+        elif column == 1:
+            if role == Qt.DisplayRole:
+                return result["model_name"]
+        elif column == 2:
+            if role == Qt.DisplayRole:
+                return _response_preview(result["response"])
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignVCenter | Qt.AlignLeft
+        return None
+    
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
         """
-        # Check if any variant is selected via radio button
-        for radio in self.variant_radios:
-            if radio.isVisible() and radio.isChecked():
-                variant_text = radio.property("variant_text")
-                if variant_text:
-                    return variant_text
+        Toggle result selection from the checkbox column.
+        """
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
         
-        # If no variant selected, return improved version
-        improved = self.improved_text.toPlainText().strip()
-        if improved and improved != "Не удалось получить улучшенную версию":
-            return improved
+        self.results[index.row()]["selected"] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+    
+    def flags(self, index: QModelIndex):
+        """
+        Return item flags; only the first column is checkable.
+        """
+        if not index.isValid():
+            return Qt.NoItemFlags
         
-        # Fallback to original
-        return self.original_prompt if self.original_prompt.strip() else None
+        # Local variables
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole):
+        """
+        Return header labels.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class ViewPromptsDialog(QDialog):
@@ -1022,6 +1770,7 @@ class ViewPromptsDialog(QDialog):
     """
     
     prompt_selected = pyqtSignal(int)  # Emitted when prompt is selected for loading
+    prompts_changed = pyqtSignal()  # Emitted after prompts are created, edited or deleted
     
     def __init__(self, parent=None):
         """
@@ -1054,27 +1803,36 @@ class ViewPromptsDialog(QDialog):
         search_label = QLabel("Поиск:")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Поиск по тексту промта или тегам...")
-        self.search_input.textChanged.connect(self.filter_prompts)
+        
+        # Filter only after typing pauses; restarting the timer drops earlier keystrokes
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.filter_prompts)
+        self.search_input.textChanged.connect(self.filter_timer.start)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
         layout.addLayout(search_layout)
         
-        # Table
-        self.prompts_table = QTableWidget()
-        self.prompts_table.setColumnCount(4)
-        self.prompts_table.setHorizontalHeaderLabels([
-            "Дата", "Промт", "Теги", "Действия"
-        ])
-        self.prompts_table.horizontalHeader().setStretchLastSection(True)
+        # Table backed by a paged model; filtering and sorting happen in the database
+        self.prompts_model = PromptsModel(self)
+        
+        self.prompts_table = QTableView()
+        self.prompts_table.setModel(self.prompts_model)
         self.prompts_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.prompts_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.prompts_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.prompts_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.prompts_table.setAlternatingRowColors(True)
         self.prompts_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.prompts_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.prompts_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.prompts_table.setSortingEnabled(True)
+        self.prompts_table.sortByColumn(0, Qt.DescendingOrder)
+        self.prompts_table.doubleClicked.connect(self.load_selected_prompt)
+        
+        # Row actions are offered on demand instead of as per-row buttons
+        self.prompts_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.prompts_table.customContextMenuRequested.connect(self.show_prompt_context_menu)
         
         layout.addWidget(self.prompts_table)
         
@@ -1118,89 +1876,27 @@ class ViewPromptsDialog(QDialog):
         self.setWindowTitle("Просмотр сохраненных промтов")
         self.setMinimumSize(900, 600)
     
+    @pyqtSlot()
     def load_prompts(self):
         """
-        Load all prompts into table.
+        Load the first page of prompts into table.
         """
         try:
-            # Local variables
-            all_prompts = db.get_all_prompts(sort_by="date", order="DESC")
-            self.all_prompts = all_prompts  # Store for filtering
-            self.filter_prompts()
+            self.prompts_model.reload()
         except Exception as e:
             logger.error(f"Error loading prompts: {e}")
             QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки промтов: {str(e)}")
     
+    @pyqtSlot()
     def filter_prompts(self):
         """
         Filter prompts based on search text.
         """
-        # Local variables
-        search_text = self.search_input.text().lower().strip()
-        
-        if not hasattr(self, 'all_prompts'):
-            return
-        
-        # Filter prompts
-        if search_text:
-            filtered_prompts = [
-                p for p in self.all_prompts
-                if search_text in p["prompt"].lower() or
-                   (p["tags"] and search_text in p["tags"].lower())
-            ]
-        else:
-            filtered_prompts = self.all_prompts
-        
-        # Update table
-        self.prompts_table.setRowCount(len(filtered_prompts))
-        
-        for row, prompt in enumerate(filtered_prompts):
-            # Date
-            date_str = prompt["date"][:10] if len(prompt["date"]) > 10 else prompt["date"]
-            date_item = QTableWidgetItem(date_str)
-            date_item.setData(Qt.UserRole, prompt["id"])
-            self.prompts_table.setItem(row, 0, date_item)
-            
-            # Prompt text (truncated for display)
-            prompt_text = prompt["prompt"]
-            display_text = prompt_text[:100] + "..." if len(prompt_text) > 100 else prompt_text
-            prompt_item = QTableWidgetItem(display_text)
-            prompt_item.setToolTip(prompt_text)  # Full text in tooltip
-            prompt_item.setData(Qt.UserRole, prompt["id"])
-            self.prompts_table.setItem(row, 1, prompt_item)
-            
-            # Tags
-            tags_text = prompt["tags"] if prompt["tags"] else ""
-            tags_item = QTableWidgetItem(tags_text)
-            self.prompts_table.setItem(row, 2, tags_item)
-            
-            # Actions buttons
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout()
-            actions_layout.setContentsMargins(2, 2, 2, 2)
-            
-            load_btn = QPushButton("Загрузить")
-            load_btn.setMaximumWidth(80)
-            load_btn.setToolTip("Загрузить промт")
-            load_btn.clicked.connect(lambda checked, p_id=prompt["id"]: self.load_prompt(p_id))
-            
-            edit_btn = QPushButton("Редактировать")
-            edit_btn.setMaximumWidth(100)
-            edit_btn.setToolTip("Редактировать промт")
-            edit_btn.clicked.connect(lambda checked, p_id=prompt["id"]: self.edit_prompt(p_id))
-            
-            delete_btn = QPushButton("Удалить")
-            delete_btn.setMaximumWidth(80)
-            delete_btn.setToolTip("Удалить промт")
-            delete_btn.clicked.connect(lambda checked, p_id=prompt["id"]: self.delete_prompt(p_id))
-            
-            actions_layout.addWidget(load_btn)
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch()
-            
-            actions_widget.setLayout(actions_layout)
-            self.prompts_table.setCellWidget(row, 3, actions_widget)
+        try:
+            self.prompts_model.set_query(self.search_input.text())
+        except Exception as e:
+            logger.error(f"Error searching prompts: {e}")
+            QMessageBox.critical(self, "Ошибка", f"Ошибка поиска промтов: {str(e)}")
     
     def get_selected_prompt_id(self) -> Optional[int]:
         """
@@ -1210,16 +1906,35 @@ class ViewPromptsDialog(QDialog):
             Optional[int]: Prompt ID or None if nothing selected
         """
         # Local variables
-        current_row = self.prompts_table.currentRow()
+        current_index = self.prompts_table.currentIndex()
         
-        if current_row < 0:
+        if not current_index.isValid():
             return None
         
-        date_item = self.prompts_table.item(current_row, 0)
-        if date_item:
-            return date_item.data(Qt.UserRole)
-        return None
+        return current_index.data(Qt.UserRole)
+    
+    @pyqtSlot(QPoint)
+    def show_prompt_context_menu(self, pos):
+        """
+        Show load/edit/delete menu for the prompt under the cursor.
+        
+        Args:
+            pos [in]: Click position in viewport coordinates
+        """
+        # Local variables
+        index = self.prompts_table.indexAt(pos)
+        
+        if not index.isValid():
+            return
+        
+        prompt_id = index.data(Qt.UserRole)
+        menu = QMenu(self)
+        menu.addAction("Загрузить", functools.partial(self.load_prompt, prompt_id))
+        menu.addAction("Редактировать", functools.partial(self.edit_prompt, prompt_id))
+        menu.addAction("Удалить", functools.partial(self.delete_prompt, prompt_id))
+        menu.exec_(self.prompts_table.viewport().mapToGlobal(pos))
     
+    @pyqtSlot()
     def load_selected_prompt(self):
         """
         Load selected prompt.
@@ -1233,6 +1948,7 @@ class ViewPromptsDialog(QDialog):
         
         self.load_prompt(prompt_id)
     
+    @pyqtSlot(int)
     def load_prompt(self, prompt_id: int):
         """
         Load prompt and close dialog.
@@ -1243,6 +1959,7 @@ class ViewPromptsDialog(QDialog):
         self.prompt_selected.emit(prompt_id)
         self.accept()
     
+    @pyqtSlot()
     def create_prompt(self):
         """
         Create a new prompt.
@@ -1255,12 +1972,12 @@ class ViewPromptsDialog(QDialog):
                 QMessageBox.information(self, "Успех", "Промт успешно создан")
                 self.load_prompts()
                 # Refresh prompts in main window
-                if hasattr(self.parent(), 'load_saved_prompts'):
-                    self.parent().load_saved_prompts()
+                self.prompts_changed.emit()
             except Exception as e:
                 logger.error(f"Error creating prompt: {e}")
                 QMessageBox.critical(self, "Ошибка", f"Ошибка создания промта: {str(e)}")
     
+    @pyqtSlot()
     def edit_selected_prompt(self):
         """
         Edit selected prompt.
@@ -1274,6 +1991,7 @@ class ViewPromptsDialog(QDialog):
         
         self.edit_prompt(prompt_id)
     
+    @pyqtSlot(int)
     def edit_prompt(self, prompt_id: int):
         """
         Edit prompt.
@@ -1289,14 +2007,14 @@ class ViewPromptsDialog(QDialog):
                     QMessageBox.information(self, "Успех", "Промт успешно обновлен")
                     self.load_prompts()
                     # Refresh prompts in main window
-                    if hasattr(self.parent(), 'load_saved_prompts'):
-                        self.parent().load_saved_prompts()
+                    self.prompts_changed.emit()
                 else:
                     QMessageBox.critical(self, "Ошибка", "Не удалось обновить промт")
             except Exception as e:
                 logger.error(f"Error updating prompt: {e}")
                 QMessageBox.critical(self, "Ошибка", f"Ошибка обновления промта: {str(e)}")
     
+    @pyqtSlot()
     def delete_selected_prompt(self):
         """
         Delete selected prompt.
@@ -1310,6 +2028,7 @@ class ViewPromptsDialog(QDialog):
         
         self.delete_prompt(prompt_id)
     
+    @pyqtSlot(int)
     def delete_prompt(self, prompt_id: int):
         """
         Delete prompt with confirmation.
@@ -1324,9 +2043,7 @@ class ViewPromptsDialog(QDialog):
                 return
             
             # Truncate prompt text for confirmation
-            prompt_text = prompt_data["prompt"][:50]
-            if len(prompt_data["prompt"]) > 50:
-                prompt_text += "..."
+            prompt_text = _prompt_label(prompt_data["prompt"])
             
             reply = QMessageBox.question(
                 self, "Подтверждение удаления",
@@ -1341,22 +2058,21 @@ class ViewPromptsDialog(QDialog):
                     QMessageBox.information(self, "Успех", "Промт успешно удален")
                     self.load_prompts()
                     # Emit signal to refresh prompts in main window
-                    if hasattr(self.parent(), 'load_saved_prompts'):
-                        self.parent().load_saved_prompts()
+                    self.prompts_changed.emit()
                 else:
                     QMessageBox.critical(self, "Ошибка", "Не удалось удалить промт")
         except Exception as e:
             logger.error(f"Error deleting prompt: {e}")
             QMessageBox.critical(self, "Ошибка", f"Ошибка удаления промта: {str(e)}")
     
+    @pyqtSlot()
     def clear_all_prompts(self):
         """
         Clear all prompts with confirmation.
         """
         try:
-            # Get count of prompts
-            all_prompts = db.get_all_prompts()
-            prompt_count = len(all_prompts)
+            # Get count of prompts (only the first page may be loaded)
+            prompt_count = db.count_prompts()
             
             if prompt_count == 0:
                 QMessageBox.information(self, "Информация", "Нет промтов для удаления")
@@ -1380,8 +2096,7 @@ class ViewPromptsDialog(QDialog):
                     )
                     self.load_prompts()
                     # Refresh prompts in main window
-                    if hasattr(self.parent(), 'load_saved_prompts'):
-                        self.parent().load_saved_prompts()
+                    self.prompts_changed.emit()
                 else:
                     QMessageBox.critical(self, "Ошибка", "Не удалось удалить промты")
         except Exception as e:
@@ -1407,6 +2122,31 @@ class MainWindow(QMainWindow):
         self.current_prompt_id = None
         self.temp_results = []  # Temporary results in memory
         self.request_worker = None
+        self.request_in_progress = False  # Results of the current request are still being drained
+        self.expected_results = 0  # Number of models queried by the current request
+        self._completed_results = 0  # Results of the current request drained so far
+        self.saved_prompts_loader = None  # Signals of the latest saved prompts load
+        self.saved_prompts_select_id = None
+        self.saved_prompts_signature = None  # (id, date, text head) of listed prompts
+        self.saved_prompts_rows = {}  # Prompt ID -> saved prompts combo row
+        self.results_saver = None  # Signals of the running results save
+        self.prompt_loader = None  # Signals of the latest prompt load
+        self.prompt_load_id = None
+        self.prompt_load_select = False  # Select the loaded prompt in the combo
+        self.prompt_creator = None  # Signals of the running prompt save
+        self.prompt_cache = {}  # Prompt ID -> prompt data used by export and improve
+        
+        # Coalesces bursts of prompt changes into a single combo reload
+        self.saved_prompts_reload_timer = QTimer(self)
+        self.saved_prompts_reload_timer.setSingleShot(True)
+        self.saved_prompts_reload_timer.setInterval(0)
+        self.saved_prompts_reload_timer.timeout.connect(self.load_saved_prompts)
+        
+        # Finished requests are queued by the worker and added to the results table in batches
+        self.result_queue = queue.Queue()
+        self.results_drain_timer = QTimer(self)
+        self.results_drain_timer.setInterval(RESULTS_DRAIN_MS)
+        self.results_drain_timer.timeout.connect(self.drain_results)
         self.prompt_improver = prompt_improver.PromptImprover()
         
         self.load_settings()
@@ -1546,14 +2286,14 @@ class MainWindow(QMainWindow):
         # Buttons
         improve_button = QPushButton("Улучшить промт")
         improve_button.clicked.connect(self.show_improve_prompt_dialog)
-        load_button = QPushButton("Загрузить промт")
-        load_button.clicked.connect(self.load_selected_prompt)
+        self.load_prompt_button = QPushButton("Загрузить промт")
+        self.load_prompt_button.clicked.connect(self.load_selected_prompt)
         self.send_button = QPushButton("Отправить")
         self.send_button.clicked.connect(self.send_prompt)
         self.send_button.setDefault(True)
         
         bottom_row.addWidget(improve_button)
-        bottom_row.addWidget(load_button)
+        bottom_row.addWidget(self.load_prompt_button)
         bottom_row.addWidget(self.send_button)
         
         layout.addLayout(bottom_row)
@@ -1576,25 +2316,28 @@ class MainWindow(QMainWindow):
         layout.addWidget(label)
         
         # Table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["Выбрать", "Модель", "Ответ", "Действия"])
+        self.results_model = ResultsModel(self.temp_results, self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setStretchLastSection(False)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.results_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
-        # Enable word wrap for all cells
-        self.results_table.setWordWrap(True)
-        # Set vertical header to resize rows to content
-        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Open buttons are painted by a delegate instead of per-row widgets
+        self.results_actions_delegate = ResultActionsDelegate(self.results_table)
+        self.results_actions_delegate.actionRequested.connect(self.on_result_action, Qt.QueuedConnection)
+        self.results_table.setItemDelegateForColumn(3, self.results_actions_delegate)
+        # Fixed single-line rows: no per-insert text layout to measure row heights.
+        # Responses are shown as an elided preview; "Открыть" shows the full text.
+        self.results_table.setWordWrap(False)
+        self.results_table.setTextElideMode(Qt.ElideRight)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.results_table.verticalHeader().setDefaultSectionSize(RESULTS_ROW_HEIGHT)
         # Set minimum height for results table to ensure buttons are visible
         self.results_table.setMinimumHeight(400)
-        # Limit maximum row height to prevent extremely tall rows
-        # This ensures that long messages are scrollable within the cell
-        self.results_table.verticalHeader().setMaximumSectionSize(300)
         
         layout.addWidget(self.results_table)
         # Set stretch factor for results section to take more vertical space
@@ -1614,49 +2357,97 @@ class MainWindow(QMainWindow):
         layout = QHBoxLayout()
         
         # Buttons
-        save_button = QPushButton("Сохранить выбранные")
-        save_button.clicked.connect(self.save_selected_results)
+        self.save_results_button = QPushButton("Сохранить выбранные")
+        self.save_results_button.clicked.connect(self.save_selected_results)
         
-        clear_button = QPushButton("Очистить")
-        clear_button.clicked.connect(self.clear_results)
+        self.clear_button = QPushButton("Очистить")
+        self.clear_button.clicked.connect(self.clear_results)
         
         export_button = QPushButton("Экспорт")
         export_button.clicked.connect(self.export_selected_results)
         
-        new_query_button = QPushButton("Новый запрос")
-        new_query_button.clicked.connect(self.new_query)
+        self.new_query_button = QPushButton("Новый запрос")
+        self.new_query_button.clicked.connect(self.new_query)
         
-        layout.addWidget(save_button)
-        layout.addWidget(clear_button)
+        layout.addWidget(self.save_results_button)
+        layout.addWidget(self.clear_button)
         layout.addWidget(export_button)
-        layout.addWidget(new_query_button)
+        layout.addWidget(self.new_query_button)
         layout.addStretch()
         
         section.setLayout(layout)
         return section
     
-    def load_saved_prompts(self):
+    def load_saved_prompts(self, select_id: Optional[int] = None):
+        """
+        Load saved prompts into combo box in the background.
+        
+        Args:
+            select_id [in]: Prompt ID to select once loaded (None keeps the placeholder)
+        """
+        # Local variables
+        runnable = DBRunnable(db.get_all_prompts, sort_by="date", order="DESC", as_dict=False)
+        
+        # Only the latest request refills the combo
+        self.saved_prompts_loader = runnable.signals
+        self.saved_prompts_select_id = select_id
+        runnable.signals.finished.connect(self.on_saved_prompts_loaded)
+        runnable.signals.error.connect(self.on_saved_prompts_error)
+        QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(object)
+    def on_saved_prompts_loaded(self, prompts: List[Any]):
         """
-        Load saved prompts into combo box.
+        Fill combo box with loaded saved prompts.
+        
+        Args:
+            prompts [in]: Prompt rows sorted by date, newest first
         """
+        if self.sender() is not self.saved_prompts_loader:
+            return
+        
+        # Local variables
+        combo = self.saved_prompts_combo
+        # Rows whose display text is unchanged need no rebuild
+        signature = tuple(
+            (p["id"], p["date"], p["prompt"][:PROMPT_LABEL_CHARS + 1]) for p in prompts
+        )
+        
         try:
-            # Local variables
-            prompts = db.get_all_prompts(sort_by="date", order="DESC")
-            self.saved_prompts_combo.clear()
-            self.saved_prompts_combo.addItem("-- Выберите сохраненный промт --", None)
-            
-            for prompt in prompts:
-                # Truncate prompt text for display
-                display_text = prompt["prompt"][:50]
-                if len(prompt["prompt"]) > 50:
-                    display_text += "..."
-                self.saved_prompts_combo.addItem(
-                    f"{display_text} ({prompt['date'][:10]})",
-                    prompt["id"]
-                )
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            try:
+                if signature != self.saved_prompts_signature:
+                    # Build a new model in one pass instead of per-item addItem() calls
+                    model = QStandardItemModel(combo)
+                    model.appendRow(QStandardItem(SAVED_PROMPTS_PLACEHOLDER))
+                    self.saved_prompts_rows = {}
+                    for prompt in prompts:
+                        self.saved_prompts_rows[prompt["id"]] = model.rowCount()
+                        item = QStandardItem(f"{_prompt_label(prompt['prompt'])} ({prompt['date'][:10]})")
+                        item.setData(prompt["id"], Qt.UserRole)
+                        model.appendRow(item)
+                    combo.setModel(model)  # The previous model is owned and deleted by the combo
+                    self.saved_prompts_signature = signature
+                
+                combo.setCurrentIndex(self.saved_prompts_rows.get(self.saved_prompts_select_id, 0))
+            finally:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
         except Exception as e:
             logger.error(f"Error loading saved prompts: {e}")
     
+    @pyqtSlot(str)
+    def on_saved_prompts_error(self, error_msg: str):
+        """
+        Log a failed saved prompts load.
+        
+        Args:
+            error_msg [in]: Error message
+        """
+        if self.sender() is self.saved_prompts_loader:
+            logger.error(f"Error loading saved prompts: {error_msg}")
+    
     def load_settings(self):
         """
         Load application settings.
@@ -1753,6 +2544,7 @@ class MainWindow(QMainWindow):
         self.status_bar.setFont(font)
     
     
+    @pyqtSlot()
     def load_selected_prompt(self):
         """
         Load selected prompt from combo box.
@@ -1764,39 +2556,82 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Информация", "Пожалуйста, выберите сохраненный промт")
             return
         
-        try:
-            prompt_data = db.get_prompt(current_data)
-            if prompt_data:
-                # Clear current prompt
-                self.prompt_text.clear()
-                self.tags_input.clear()
-                
-                # Set new prompt
-                prompt_text_value = prompt_data["prompt"]
-                self.prompt_text.setPlainText(prompt_text_value)
-                self.prompt_text.update()  # Force update
-                
-                if prompt_data["tags"]:
-                    self.tags_input.setText(prompt_data["tags"])
-                else:
-                    self.tags_input.clear()
-                self.tags_input.update()  # Force update
-                
-                self.current_prompt_id = current_data
-                
-                # Load saved results for this prompt
-                self.load_saved_results_for_prompt(current_data)
-                
-                self.status_bar.showMessage(f"Промт загружен (ID: {current_data})")
-                
-                # Ensure text is visible
-                self.prompt_text.ensureCursorVisible()
-            else:
-                QMessageBox.warning(self, "Предупреждение", "Промт не найден в базе данных")
-        except Exception as e:
-            logger.error(f"Error loading prompt: {e}")
-            QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки промта: {str(e)}")
+        self.start_prompt_load(current_data)
+    
+    def start_prompt_load(self, prompt_id: int, select_in_combo: bool = False):
+        """
+        Load a prompt with its saved results in the background.
+        
+        Args:
+            prompt_id [in]: Prompt ID to load
+            select_in_combo [in]: Refresh saved prompts combo and select the prompt once loaded
+        """
+        # Local variables
+        runnable = DBRunnable(db.get_prompt_with_results, prompt_id)
+        
+        self.prompt_cache.clear()
+        # Only the latest request fills the prompt and results
+        self.prompt_loader = runnable.signals
+        self.prompt_load_id = prompt_id
+        self.prompt_load_select = select_in_combo
+        runnable.signals.finished.connect(self.on_prompt_loaded)
+        runnable.signals.error.connect(self.on_prompt_load_error)
+        self.status_bar.showMessage("Загрузка промта...")
+        QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(object)
+    def on_prompt_loaded(self, prompt_data: Optional[Dict[str, Any]]):
+        """
+        Show loaded prompt and its saved results.
+        
+        Args:
+            prompt_data [in]: Prompt data with "results" list or None if not found
+        """
+        if self.sender() is not self.prompt_loader:
+            return
+        
+        # Local variables
+        prompt_id = self.prompt_load_id
+        
+        if not prompt_data:
+            QMessageBox.warning(self, "Предупреждение", "Промт не найден в базе данных")
+            return
+        
+        # Clear current prompt
+        self.prompt_text.clear()
+        self.tags_input.clear()
+        
+        # Set new prompt
+        self.prompt_text.setPlainText(prompt_data["prompt"])
+        if prompt_data["tags"]:
+            self.tags_input.setText(prompt_data["tags"])
+        
+        self.current_prompt_id = prompt_id
+        self.prompt_creator = None  # A pending save no longer belongs to the shown prompt
+        
+        # Show saved results for this prompt
+        self.load_saved_results_for_prompt(prompt_data["results"])
+        
+        self.status_bar.showMessage(f"Промт загружен (ID: {prompt_id})")
+        
+        if self.prompt_load_select:
+            # Refresh saved prompts combo and select the loaded prompt
+            self.load_saved_prompts(select_id=prompt_id)
+    
+    @pyqtSlot(str)
+    def on_prompt_load_error(self, error_msg: str):
+        """
+        Report failed prompt load.
+        
+        Args:
+            error_msg [in]: Error message
+        """
+        if self.sender() is not self.prompt_loader:
+            return
+        logger.error(f"Error loading prompt: {error_msg}")
+        QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки промта: {error_msg}")
     
+    @pyqtSlot()
     def send_prompt(self):
         """
         Send prompt to all active models.
@@ -1820,18 +2655,18 @@ class MainWindow(QMainWindow):
         # Clear previous results
         self.clear_results()
         
-        # Save prompt to database if new
+        # Save prompt to database if new; requests do not wait for the save
         if self.current_prompt_id is None:
-            try:
-                tags = self.tags_input.text().strip() or None
-                self.current_prompt_id = db.create_prompt(prompt_text, tags)
-                self.load_saved_prompts()  # Refresh combo
-                self.status_bar.showMessage("Промт сохранен")
-            except Exception as e:
-                logger.error(f"Error saving prompt: {e}")
+            runnable = DBRunnable(db.create_prompt, prompt_text, self.tags_input.text().strip() or None)
+            self.prompt_creator = runnable.signals
+            runnable.signals.finished.connect(self.on_prompt_created)
+            runnable.signals.error.connect(self.on_prompt_create_error)
+            QThreadPool.globalInstance().start(runnable)
         
-        # Disable send button
-        self.send_button.setEnabled(False)
+        # Results are tied to the current prompt until the request ends, so
+        # nothing may replace the prompt or results meanwhile
+        self.prompt_loader = None
+        self.set_request_controls_enabled(False)
         
         # Show progress
         self.progress_bar.setMaximum(len(active_models))
@@ -1839,14 +2674,51 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(True)
         self.status_bar.showMessage(f"Отправка в {len(active_models)} моделей...")
         
-        # Create and start worker thread
+        # Create and start worker thread; its results are drained until it finishes
+        self.expected_results = len(active_models)
+        self._completed_results = 0
+        self.result_queue = queue.Queue()
         self.request_worker = RequestWorker(
-            active_models, prompt_text, self.timeout, self.max_retries
+            active_models, prompt_text, self.result_queue, self.timeout, self.max_retries
         )
-        self.request_worker.finished.connect(self.on_request_finished)
+        # Owned by the window until its thread ends, even once a newer request replaces it
+        self.request_worker.setParent(self)
         self.request_worker.progress.connect(self.on_request_progress)
+        self.request_worker.finished.connect(self.on_request_finished)
+        self.request_worker.finished.connect(self.request_worker.deleteLater)
+        self.request_in_progress = True
+        self.results_drain_timer.start()
         self.request_worker.start()
     
+    @pyqtSlot(object)
+    def on_prompt_created(self, prompt_id: int):
+        """
+        Remember the ID of the prompt saved by send_prompt().
+        
+        Args:
+            prompt_id [in]: ID of the created prompt
+        """
+        # A prompt loaded or cleared meanwhile keeps its own ID
+        if self.sender() is not self.prompt_creator:
+            return
+        self.prompt_creator = None
+        self.current_prompt_id = prompt_id
+        self.load_saved_prompts()  # Refresh combo
+        self.status_bar.showMessage("Промт сохранен")
+    
+    @pyqtSlot(str)
+    def on_prompt_create_error(self, error_msg: str):
+        """
+        Log failed prompt save.
+        
+        Args:
+            error_msg [in]: Error message
+        """
+        if self.sender() is self.prompt_creator:
+            self.prompt_creator = None
+            logger.error(f"Error saving prompt: {error_msg}")
+    
+    @pyqtSlot(int, int)
     def on_request_progress(self, current: int, total: int):
         """
         Handle request progress update.
@@ -1857,76 +2729,64 @@ class MainWindow(QMainWindow):
         """
         self.progress_bar.setValue(current)
     
-    def on_request_finished(self, model_id: int, model_name: str, api_id: str, response: str):
+    @pyqtSlot()
+    def drain_results(self):
+        """
+        Move results queued by the request worker into the table in one update.
+        """
+        # Local variables
+        batch = []
+        
+        while True:
+            try:
+                batch.append(self.result_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        if not batch:
+            return
+        self.results_model.append_results(batch)
+        
+        # Each model yields exactly one result; the worker's finished signal
+        # ends the request too if a result never arrives
+        self._completed_results += len(batch)
+        if self._completed_results >= self.expected_results:
+            self.finish_request()
+    
+    @pyqtSlot()
+    def on_request_finished(self):
+        """
+        Add the last queued results once the request worker thread has finished.
+        """
+        if self.sender() is not self.request_worker:
+            return
+        self.drain_results()
+        self.finish_request()
+    
+    def finish_request(self):
         """
-        Handle finished request.
+        Stop draining results and re-enable sending after the current request.
+        """
+        if not self.request_in_progress:
+            return
+        self.request_in_progress = False
+        self.results_drain_timer.stop()
+        self.progress_bar.setVisible(False)
+        self.set_request_controls_enabled(True)
+        self.status_bar.showMessage("Все запросы завершены")
+    
+    def set_request_controls_enabled(self, enabled: bool):
+        """
+        Enable or disable controls that send a prompt or replace the prompt and results.
         
         Args:
-            model_id [in]: Model ID
-            model_name [in]: Model name
-            api_id [in]: Environment variable name for API key
-            response [in]: Response text or error message
-        """
-        # Add to temporary results
-        result = {
-            "model_id": model_id,
-            "model_name": model_name,
-            "api_id": api_id,
-            "response": response,
-            "selected": False
-        }
-        self.temp_results.append(result)
-        
-        # Update table
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
-        
-        # Checkbox (first column)
-        checkbox = QCheckBox()
-        checkbox.setChecked(False)
-        # Store result index in checkbox data for easy retrieval
-        checkbox.setProperty("result_index", len(self.temp_results) - 1)
-        self.results_table.setCellWidget(row, 0, checkbox)
-        
-        # Model name
-        model_item = QTableWidgetItem(model_name)
-        model_item.setFlags(model_item.flags() & ~Qt.ItemIsEditable)
-        # Store result index in item data
-        model_item.setData(Qt.UserRole, len(self.temp_results) - 1)
-        self.results_table.setItem(row, 1, model_item)
-        
-        # Response text (multiline)
-        response_item = QTableWidgetItem(response)
-        response_item.setFlags(response_item.flags() & ~Qt.ItemIsEditable)
-        # Enable word wrap for response text
-        response_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
-        self.results_table.setItem(row, 2, response_item)
-        
-        # Actions column - Open button
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout()
-        actions_layout.setContentsMargins(2, 2, 2, 2)
-        
-        open_btn = QPushButton("Открыть")
-        open_btn.setMaximumWidth(80)
-        open_btn.clicked.connect(lambda checked, r=response, m=model_name: self.open_markdown_view(m, r))
-        
-        actions_layout.addWidget(open_btn)
-        actions_layout.addStretch()
-        
-        actions_widget.setLayout(actions_layout)
-        self.results_table.setCellWidget(row, 3, actions_widget)
-        
-        # Resize row to fit content
-        self.results_table.resizeRowToContents(row)
-        
-        # Check if all requests finished
-        if len(self.temp_results) >= len(models.get_active_models()):
-            self.progress_bar.setVisible(False)
-            # Re-enable send button
-            self.send_button.setEnabled(True)
-            self.status_bar.showMessage("Все запросы завершены")
+            enabled [in]: True to enable controls
+        """
+        for button in (self.send_button, self.load_prompt_button,
+                       self.clear_button, self.new_query_button):
+            button.setEnabled(enabled)
     
+    @pyqtSlot()
     def save_selected_results(self):
         """
         Save selected results to database.
@@ -1940,151 +2800,109 @@ class MainWindow(QMainWindow):
             return
         
         # Local variables
-        saved_count = 0
-        errors = []
+        # Selection is stored in the result dicts by the results model
+        items = [
+            (self.current_prompt_id, result["model_id"], result["response"], None)
+            for result in self.temp_results if result["selected"]
+        ]
+        
+        if not items:
+            QMessageBox.information(self, "Информация", "Нет выбранных результатов")
+            return
         
-        try:
-            # Iterate through all rows in the table
-            for row in range(self.results_table.rowCount()):
-                # Get checkbox from first column
-                checkbox = self.results_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    # Get result index from checkbox property or model item
-                    result_index = checkbox.property("result_index")
-                    if result_index is None:
-                        # Fallback: try to get from model item
-                        model_item = self.results_table.item(row, 1)
-                        if model_item:
-                            result_index = model_item.data(Qt.UserRole)
-                    
-                    # Validate result index
-                    if result_index is not None and 0 <= result_index < len(self.temp_results):
-                        result = self.temp_results[result_index]
-                        try:
-                            db.create_result(
-                                self.current_prompt_id,
-                                result["model_id"],
-                                result["response"]
-                            )
-                            saved_count += 1
-                        except Exception as e:
-                            error_msg = f"Ошибка сохранения результата для модели {result['model_name']}: {str(e)}"
-                            logger.error(error_msg)
-                            errors.append(error_msg)
-                    else:
-                        logger.warning(f"Invalid result index {result_index} for row {row}")
-            
-            # Show results
-            if saved_count > 0:
-                message = f"Сохранено {saved_count} результат(ов) в базу данных"
-                if errors:
-                    message += f"\n\nОшибки при сохранении:\n" + "\n".join(errors)
-                    QMessageBox.warning(self, "Частичный успех", message)
-                else:
-                    QMessageBox.information(self, "Успех", message)
-                self.status_bar.showMessage(f"Сохранено {saved_count} результат(ов)")
-            else:
-                if errors:
-                    QMessageBox.warning(self, "Ошибка", "Не удалось сохранить результаты:\n" + "\n".join(errors))
-                else:
-                    QMessageBox.information(self, "Информация", "Нет выбранных результатов")
-        except Exception as e:
-            logger.error(f"Error saving results: {e}")
-            QMessageBox.critical(self, "Ошибка", f"Ошибка сохранения результатов: {str(e)}")
+        # All selected results are written in one transaction in the thread pool
+        runnable = DBRunnable(db.create_results_bulk, items)
+        self.results_saver = runnable.signals  # Keeps signals alive until delivered
+        runnable.signals.finished.connect(self.on_results_saved)
+        runnable.signals.error.connect(self.on_results_save_error)
+        self.save_results_button.setEnabled(False)
+        self.status_bar.showMessage("Сохранение результатов...")
+        QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(object)
+    def on_results_saved(self, saved_count: int):
+        """
+        Report saved results.
+        
+        Args:
+            saved_count [in]: Number of saved results
+        """
+        self.save_results_button.setEnabled(True)
+        QMessageBox.information(
+            self, "Успех", f"Сохранено {saved_count} результат(ов) в базу данных"
+        )
+        self.status_bar.showMessage(f"Сохранено {saved_count} результат(ов)")
+    
+    @pyqtSlot(str)
+    def on_results_save_error(self, error_msg: str):
+        """
+        Report failed results save.
+        
+        Args:
+            error_msg [in]: Error message
+        """
+        self.save_results_button.setEnabled(True)
+        logger.error(f"Error saving results: {error_msg}")
+        QMessageBox.critical(self, "Ошибка", f"Ошибка сохранения результатов: {error_msg}")
     
+    @pyqtSlot()
     def clear_results(self):
         """
         Clear results table.
         """
-        self.results_table.setRowCount(0)
-        self.temp_results = []
+        self.results_model.replace_results([])
         self.status_bar.showMessage("Результаты очищены")
     
-    def load_saved_results_for_prompt(self, prompt_id: int):
+    def load_saved_results_for_prompt(self, saved_results: List[Dict[str, Any]]):
         """
-        Load saved results for a specific prompt and display them in the results table.
+        Display saved results of a prompt in the results table.
         
         Args:
-            prompt_id [in]: Prompt ID to load results for
+            saved_results [in]: Results fetched in the background with the prompt
         """
         try:
             # Clear current results
-            self.results_table.setRowCount(0)
-            self.temp_results = []
-            
-            # Get saved results from database
-            saved_results = db.get_results_by_prompt(prompt_id)
+            self.results_model.replace_results([])
             
             if not saved_results:
                 self.status_bar.showMessage("Нет сохраненных результатов для этого промта")
                 return
             
-            # Load model names for display
-            all_models = models.get_all_models()
-            model_dict = {model.id: model.name for model in all_models}
+            # Load names of the models that produced these results in one lookup
+            result_models = models.get_models_by_ids({result["model_id"] for result in saved_results})
+            model_dict = {model_id: model.name for model_id, model in result_models.items()}
             
-            # Display results in table
-            for result in saved_results:
-                model_id = result["model_id"]
-                model_name = model_dict.get(model_id, f"Модель ID: {model_id}")
-                response_text = result["response_text"]
-                
-                # Add to temporary results
-                temp_result = {
-                    "model_id": model_id,
-                    "model_name": model_name,
+            # Build all rows in Python first, then add them with one insert notification
+            loaded_results = [
+                {
+                    "model_id": result["model_id"],
+                    "model_name": model_dict.get(result["model_id"], f"Модель ID: {result['model_id']}"),
                     "api_id": "",  # Not available for saved results
-                    "response": response_text,
-                    "selected": False
+                    "response": result["response_text"],
+                    "selected": False  # Unchecked by default for saved results
                 }
-                self.temp_results.append(temp_result)
-                
-                # Add row to table
-                row = self.results_table.rowCount()
-                self.results_table.insertRow(row)
-                
-                # Checkbox (first column) - unchecked by default for saved results
-                checkbox = QCheckBox()
-                checkbox.setChecked(False)
-                checkbox.setProperty("result_index", len(self.temp_results) - 1)
-                self.results_table.setCellWidget(row, 0, checkbox)
-                
-                # Model name
-                model_item = QTableWidgetItem(model_name)
-                model_item.setFlags(model_item.flags() & ~Qt.ItemIsEditable)
-                model_item.setData(Qt.UserRole, len(self.temp_results) - 1)
-                self.results_table.setItem(row, 1, model_item)
-                
-                # Response text (multiline)
-                response_item = QTableWidgetItem(response_text)
-                response_item.setFlags(response_item.flags() & ~Qt.ItemIsEditable)
-                # Enable word wrap for response text
-                response_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
-                self.results_table.setItem(row, 2, response_item)
-                
-                # Actions column - Open button
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout()
-                actions_layout.setContentsMargins(2, 2, 2, 2)
-                
-                open_btn = QPushButton("Открыть")
-                open_btn.setMaximumWidth(80)
-                open_btn.clicked.connect(lambda checked, r=response_text, m=model_name: self.open_markdown_view(m, r))
-                
-                actions_layout.addWidget(open_btn)
-                actions_layout.addStretch()
-                
-                actions_widget.setLayout(actions_layout)
-                self.results_table.setCellWidget(row, 3, actions_widget)
-                
-                # Resize row to fit content
-                self.results_table.resizeRowToContents(row)
+                for result in saved_results
+            ]
+            self.results_model.append_results(loaded_results)
             
             self.status_bar.showMessage(f"Загружено {len(saved_results)} сохраненных результат(ов)")
         except Exception as e:
             logger.error(f"Error loading saved results: {e}")
             QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки сохраненных результатов: {str(e)}")
     
+    @pyqtSlot(int, str)
+    def on_result_action(self, row: int, action: str):
+        """
+        Handle action button clicked in the results table.
+        
+        Args:
+            row [in]: Results table row
+            action [in]: Action name ("open")
+        """
+        if action == "open" and 0 <= row < len(self.temp_results):
+            result = self.temp_results[row]
+            self.open_markdown_view(result["model_name"], result["response"])
+    
     def open_markdown_view(self, model_name: str, response_text: str):
         """
         Open markdown view dialog for a response.
@@ -2100,6 +2918,7 @@ class MainWindow(QMainWindow):
         )
         dialog.exec_()
     
+    @pyqtSlot()
     def new_query(self):
         """
         Start new query (clear prompt and results).
@@ -2107,9 +2926,12 @@ class MainWindow(QMainWindow):
         self.prompt_text.clear()
         self.tags_input.clear()
         self.current_prompt_id = None
+        self.prompt_creator = None
+        self.prompt_cache.clear()
         self.clear_results()
         self.status_bar.showMessage("Готово к новому запросу")
     
+    @pyqtSlot()
     def export_selected_results(self):
         """
         Export selected results to file.
@@ -2136,15 +2958,10 @@ class MainWindow(QMainWindow):
         
         try:
             # Collect selected results
-            selected_results = []
-            for idx, result in enumerate(self.temp_results):
-                checkbox = self.results_table.cellWidget(idx, 0)
-                if checkbox and checkbox.isChecked():
-                    selected_results.append(result)
-            
-            if not selected_results:
+            if not any(result["selected"] for result in self.temp_results):
                 QMessageBox.information(self, "Информация", "Нет выбранных результатов")
                 return
+            selected_results = (result for result in self.temp_results if result["selected"])
             
             # Export based on format
             if export_format == "markdown":
@@ -2157,21 +2974,21 @@ class MainWindow(QMainWindow):
             logger.error(f"Error exporting results: {e}")
             QMessageBox.critical(self, "Ошибка", f"Ошибка экспорта: {str(e)}")
     
-    def export_to_markdown(self, file_path: str, results: List[Dict[str, Any]]):
+    def export_to_markdown(self, file_path: str, results: Iterable[Dict[str, Any]]):
         """
         Export results to Markdown format.
         
         Args:
             file_path [in]: Output file path
-            results [in]: List of results to export
+            results [in]: Results to export
         """
-        with open(file_path, "w", encoding="utf-8") as f:
+        with open(file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
             f.write(f"# Экспорт ChatList v{version.__version__}\n\n")
             f.write(f"**Дата экспорта:** {datetime.now().isoformat()}\n\n")
             
             if self.current_prompt_id:
                 try:
-                    prompt_data = db.get_prompt(self.current_prompt_id)
+                    prompt_data = self.get_cached_prompt(self.current_prompt_id)
                     if prompt_data:
                         f.write(f"**Промт:** {prompt_data['prompt']}\n\n")
                         if prompt_data["tags"]:
@@ -2182,38 +2999,52 @@ class MainWindow(QMainWindow):
             f.write("---\n\n")
             
             for result in results:
-                f.write(f"## {result['model_name']}\n\n")
-                f.write(f"{result['response']}\n\n")
-                f.write("---\n\n")
+                f.write(f"## {result['model_name']}\n\n{result['response']}\n\n---\n\n")
     
-    def export_to_json(self, file_path: str, results: List[Dict[str, Any]]):
+    def export_to_json(self, file_path: str, results: Iterable[Dict[str, Any]]):
         """
         Export results to JSON format.
+        Results are serialized one at a time, so the whole document is never built in memory.
         
         Args:
             file_path [in]: Output file path
-            results [in]: List of results to export
+            results [in]: Results to export
         """
         # Local variables
-        export_data = {
+        header = {
             "version": version.__version__,
             "export_date": datetime.now().isoformat(),
-            "prompt_id": self.current_prompt_id,
-            "results": results
+            "prompt_id": self.current_prompt_id
         }
+        trailer = {}
+        has_results = False
         
         if self.current_prompt_id:
             try:
-                prompt_data = db.get_prompt(self.current_prompt_id)
+                prompt_data = self.get_cached_prompt(self.current_prompt_id)
                 if prompt_data:
-                    export_data["prompt"] = prompt_data["prompt"]
-                    export_data["tags"] = prompt_data["tags"]
+                    trailer["prompt"] = prompt_data["prompt"]
+                    trailer["tags"] = prompt_data["tags"]
             except Exception:
                 pass
         
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-    
+        # Same layout as json.dump(..., indent=2) of the whole document
+        with open(file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write("{")
+            for key, value in header.items():
+                f.write(f"\n  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},")
+            f.write('\n  "results": [')
+            for result in results:
+                # Selection is view state; exported results keep "selected": false
+                item = json.dumps(dict(result, selected=False), indent=2, ensure_ascii=False)
+                f.write(("," if has_results else "") + "\n    " + item.replace("\n", "\n    "))
+                has_results = True
+            f.write("\n  ]" if has_results else "]")
+            for key, value in trailer.items():
+                f.write(f",\n  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}")
+            f.write("\n}")
+    
+    @pyqtSlot()
     def add_model(self):
         """
         Show dialog to add new model.
@@ -2241,6 +3072,7 @@ class MainWindow(QMainWindow):
                 else:
                     QMessageBox.critical(self, "Ошибка", "Не удалось добавить модель")
     
+    @pyqtSlot()
     def manage_models(self):
         """
         Show dialog to manage models.
@@ -2248,14 +3080,35 @@ class MainWindow(QMainWindow):
         dialog = ManageModelsDialog(self)
         dialog.exec_()
     
+    @pyqtSlot()
     def view_saved_prompts(self):
         """
         Show saved prompts dialog.
         """
         dialog = ViewPromptsDialog(self)
         dialog.prompt_selected.connect(self.load_prompt_by_id)
+        dialog.prompts_changed.connect(self.saved_prompts_reload_timer.start)
+        dialog.prompts_changed.connect(self.prompt_cache.clear)
         dialog.exec_()
     
+    def get_cached_prompt(self, prompt_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get prompt data, reusing the copy fetched earlier for the same prompt.
+        
+        Args:
+            prompt_id [in]: Prompt ID
+        
+        Returns:
+            Optional[Dict[str, Any]]: Prompt data or None if not found
+        """
+        if prompt_id not in self.prompt_cache:
+            prompt_data = db.get_prompt(prompt_id)
+            if prompt_data is None:
+                return None
+            self.prompt_cache[prompt_id] = prompt_data
+        return self.prompt_cache[prompt_id]
+    
+    @pyqtSlot(int)
     def load_prompt_by_id(self, prompt_id: int):
         """
         Load prompt by ID into main window.
@@ -2263,48 +3116,13 @@ class MainWindow(QMainWindow):
         Args:
             prompt_id [in]: Prompt ID to load
         """
-        try:
-            prompt_data = db.get_prompt(prompt_id)
-            if prompt_data:
-                # Clear current prompt
-                self.prompt_text.clear()
-                self.tags_input.clear()
-                
-                # Set new prompt
-                prompt_text_value = prompt_data["prompt"]
-                self.prompt_text.setPlainText(prompt_text_value)
-                self.prompt_text.update()  # Force update
-                
-                if prompt_data["tags"]:
-                    self.tags_input.setText(prompt_data["tags"])
-                else:
-                    self.tags_input.clear()
-                self.tags_input.update()  # Force update
-                
-                self.current_prompt_id = prompt_id
-                
-                # Load saved results for this prompt
-                self.load_saved_results_for_prompt(prompt_id)
-                
-                self.status_bar.showMessage(f"Промт загружен (ID: {prompt_id})")
-                
-                # Refresh saved prompts combo and select the loaded prompt
-                self.load_saved_prompts()
-                
-                # Select the loaded prompt in combo box
-                for i in range(self.saved_prompts_combo.count()):
-                    if self.saved_prompts_combo.itemData(i) == prompt_id:
-                        self.saved_prompts_combo.setCurrentIndex(i)
-                        break
-                
-                # Ensure text is visible
-                self.prompt_text.ensureCursorVisible()
-            else:
-                QMessageBox.warning(self, "Предупреждение", "Промт не найден в базе данных")
-        except Exception as e:
-            logger.error(f"Error loading prompt: {e}")
-            QMessageBox.critical(self, "Ошибка", f"Ошибка загрузки промта: {str(e)}")
+        if self.request_in_progress:
+            QMessageBox.information(self, "Информация", "Дождитесь завершения запросов")
+            return
+        
+        self.start_prompt_load(prompt_id, select_in_combo=True)
     
+    @pyqtSlot()
     def show_settings_dialog(self):
         """
         Show settings dialog.
@@ -2315,9 +3133,11 @@ class MainWindow(QMainWindow):
                 # Local variables
                 settings = dialog.get_settings()
                 
-                # Save settings to database
-                db.set_setting("theme", settings["theme"])
-                db.set_setting("font_size", str(settings["font_size"]))
+                # Save settings to database in one transaction
+                db.set_settings({
+                    "theme": settings["theme"],
+                    "font_size": str(settings["font_size"])
+                })
                 
                 # Update local settings
                 self.theme = settings["theme"]
@@ -2337,6 +3157,7 @@ class MainWindow(QMainWindow):
                     f"Ошибка сохранения настроек: {str(e)}"
                 )
     
+    @pyqtSlot()
     def show_improve_prompt_dialog(self):
         """
         Show prompt improvement dialog.
@@ -2356,7 +3177,7 @@ class MainWindow(QMainWindow):
                 current_data = self.saved_prompts_combo.currentData()
                 if current_data:
                     try:
-                        prompt_data = db.get_prompt(current_data)
+                        prompt_data = self.get_cached_prompt(current_data)
                         if prompt_data:
                             prompt_text = prompt_data["prompt"]
                         else:
@@ -2420,6 +3241,7 @@ class MainWindow(QMainWindow):
                 self.prompt_text.setPlainText(selected_prompt)
                 self.status_bar.showMessage("Улучшенный промт подставлен в поле ввода")
     
+    @pyqtSlot()
     def show_about(self):
         """
         Show about dialog.
@@ -4,7 +4,7 @@ Provides model management and configuration.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 import db
 
 
@@ -12,6 +12,11 @@ import db
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Model instances keyed by ID (in name order), paired with the db models cache
+# version they were built from; None until loaded. Every write to the models
+# table bumps that version in db, so the instances are rebuilt after any writer.
+_cache: Optional[Tuple[int, Dict[int, "Model"]]] = None
+
 
 class Model:
     """
@@ -64,6 +69,49 @@ class Model:
         }
 
 
+def _model_from_dict(model_data: Dict[str, Any]) -> Model:
+    """
+    Build Model instance from a database row.
+    
+    Args:
+        model_data [in]: Model data from database
+    
+    Returns:
+        Model: Model instance
+    """
+    return Model(
+        model_id=model_data["id"],
+        name=model_data["name"],
+        model_id_value=model_data.get("model_id", model_data["name"]),  # Fallback to name for compatibility
+        api_url=model_data["api_url"],
+        api_id=model_data["api_id"],
+        is_active=model_data["is_active"]
+    )
+
+
+def _load_models() -> Dict[int, Model]:
+    """
+    Get all Model instances keyed by ID, rebuilding them after a models table write.
+    
+    Returns:
+        Dict[int, Model]: Models keyed by ID, ordered by name
+    """
+    global _cache
+    
+    # Local variables
+    # Read the version before loading, so a write during the load forces another rebuild
+    version = db.get_models_version()
+    cache = _cache
+    
+    if cache is not None and cache[0] == version:
+        return cache[1]
+    
+    loaded = {model["id"]: _model_from_dict(model) for model in db.get_all_models()}
+    # Replaced as one tuple, so readers never see a version with another map
+    _cache = (version, loaded)
+    return loaded
+
+
 def get_active_models() -> List[Model]:
     """
     Get all active models from database.
@@ -72,18 +120,7 @@ def get_active_models() -> List[Model]:
         List[Model]: List of active Model instances
     """
     try:
-        models_data = db.get_active_models()
-        return [
-            Model(
-                model_id=model["id"],
-                name=model["name"],
-                model_id_value=model.get("model_id", model["name"]),  # Fallback to name for compatibility
-                api_url=model["api_url"],
-                api_id=model["api_id"],
-                is_active=model["is_active"]
-            )
-            for model in models_data
-        ]
+        return [model for model in _load_models().values() if model.is_active == 1]
     except Exception as e:
         logger.error(f"Error getting active models: {e}")
         return []
@@ -100,63 +137,119 @@ def load_model_config(model_id: int) -> Optional[Model]:
         Optional[Model]: Model instance or None if not found
     """
     try:
-        model_data = db.get_model(model_id)
-        if model_data:
-            return Model(
-                model_id=model_data["id"],
-                name=model_data["name"],
-                model_id_value=model_data.get("model_id", model_data["name"]),  # Fallback to name for compatibility
-                api_url=model_data["api_url"],
-                api_id=model_data["api_id"],
-                is_active=model_data["is_active"]
-            )
-        return None
+        return _load_models().get(model_id)
     except Exception as e:
         logger.error(f"Error loading model config: {e}")
         return None
 
 
-def validate_model_config(name: str, model_id: str, api_url: str, api_id: str) -> tuple[bool, Optional[str]]:
+def get_models_by_ids(model_ids: Iterable[int]) -> Dict[int, Model]:
     """
-    Validate model configuration.
+    Load several model configurations by ID at once.
     
     Args:
-        name [in]: Model display name
-        model_id [in]: Model identifier for API requests
-        api_url [in]: API endpoint URL
-        api_id [in]: Environment variable name for API key
+        model_ids [in]: Model IDs
     
     Returns:
-        tuple[bool, Optional[str]]: (is_valid, error_message)
+        Dict[int, Model]: Model instances keyed by ID (missing IDs are omitted)
     """
-    # Local variables
-    error_msg = None
+    try:
+        # Local variables
+        models = _load_models()
+        
+        return {model_id: models[model_id] for model_id in model_ids if model_id in models}
+    except Exception as e:
+        logger.error(f"Error loading model configs: {e}")
+        return {}
+
+
+def _validate_name(name: str) -> Optional[str]:
+    """
+    Validate model display name.
     
-    # Validate name
+    Args:
+        name [in]: Model display name
+    
+    Returns:
+        Optional[str]: Error message or None if valid
+    """
     if not name or not name.strip():
-        error_msg = "Название модели не может быть пустым"
-        return (False, error_msg)
+        return "Название модели не может быть пустым"
+    return None
+
+
+def _validate_model_id(model_id: str) -> Optional[str]:
+    """
+    Validate model identifier.
     
-    # Validate model_id
+    Args:
+        model_id [in]: Model identifier for API requests
+    
+    Returns:
+        Optional[str]: Error message or None if valid
+    """
     if not model_id or not model_id.strip():
-        error_msg = "Идентификатор модели (model_id) не может быть пустым"
-        return (False, error_msg)
+        return "Идентификатор модели (model_id) не может быть пустым"
+    return None
+
+
+def _validate_api_url(api_url: str) -> Optional[str]:
+    """
+    Validate API endpoint URL.
     
-    # Validate API URL
+    Args:
+        api_url [in]: API endpoint URL
+    
+    Returns:
+        Optional[str]: Error message or None if valid
+    """
     if not api_url or not api_url.strip():
-        error_msg = "API URL не может быть пустым"
-        return (False, error_msg)
+        return "API URL не может быть пустым"
     
     # Check if URL starts with http:// or https://
     if not (api_url.startswith("http://") or api_url.startswith("https://")):
-        error_msg = "API URL должен начинаться с http:// или https://"
-        return (False, error_msg)
+        return "API URL должен начинаться с http:// или https://"
+    return None
+
+
+def _validate_api_id(api_id: str) -> Optional[str]:
+    """
+    Validate API key environment variable name.
+    
+    Args:
+        api_id [in]: Environment variable name for API key
     
-    # Validate API ID
+    Returns:
+        Optional[str]: Error message or None if valid
+    """
     if not api_id or not api_id.strip():
-        error_msg = "API ID (имя переменной окружения) не может быть пустым"
-        return (False, error_msg)
+        return "API ID (имя переменной окружения) не может быть пустым"
+    return None
+
+
+def validate_model_config(name: str, model_id: str, api_url: str, api_id: str) -> tuple[bool, Optional[str]]:
+    """
+    Validate model configuration.
     
+    Args:
+        name [in]: Model display name
+        model_id [in]: Model identifier for API requests
+        api_url [in]: API endpoint URL
+        api_id [in]: Environment variable name for API key
+    
+    Returns:
+        tuple[bool, Optional[str]]: (is_valid, error_message)
+    """
+    # Local variables
+    error_msg = (
+        _validate_name(name)
+        or _validate_model_id(model_id)
+        or _validate_api_url(api_url)
+        or _validate_api_id(api_id)
+    )
+    
+    if error_msg:
+        return (False, error_msg)
     return (True, None)
 
 
@@ -168,18 +261,7 @@ def get_all_models() -> List[Model]:
         List[Model]: List of all Model instances
     """
     try:
-        models_data = db.get_all_models()
-        return [
-            Model(
-                model_id=model["id"],
-                name=model["name"],
-                model_id_value=model.get("model_id", model["name"]),  # Fallback to name for compatibility
-                api_url=model["api_url"],
-                api_id=model["api_id"],
-                is_active=model["is_active"]
-            )
-            for model in models_data
-        ]
+        return list(_load_models().values())
     except Exception as e:
         logger.error(f"Error getting all models: {e}")
         return []
@@ -238,26 +320,23 @@ def update_model(model_id: int, name: Optional[str] = None,
         bool: True if updated successfully
     """
     try:
-        # If updating name, model_id, api_url, or api_id, validate them
-        if name is not None or model_id_value is not None or api_url is not None or api_id is not None:
-            # Load current model to get full config
-            current_model = load_model_config(model_id)
-            if not current_model:
-                return False
-            
-            # Use provided values or current values
-            new_name = name if name is not None else current_model.name
-            new_model_id = model_id_value if model_id_value is not None else current_model.model_id
-            new_api_url = api_url if api_url is not None else current_model.api_url
-            new_api_id = api_id if api_id is not None else current_model.api_id
-            
-            # Validate
-            is_valid, error_msg = validate_model_config(new_name, new_model_id, new_api_url, new_api_id)
-            if not is_valid:
-                logger.error(f"Invalid model config: {error_msg}")
-                return False
+        # Validate only the fields being changed; there are no cross-field rules,
+        # so the current model does not need to be loaded
+        changes = (
+            (name, _validate_name),
+            (model_id_value, _validate_model_id),
+            (api_url, _validate_api_url),
+            (api_id, _validate_api_id),
+        )
+        for value, validate in changes:
+            if value is not None:
+                error_msg = validate(value)
+                if error_msg:
+                    logger.error(f"Invalid model config: {error_msg}")
+                    return False
         
-        return db.update_model(model_id, name, model_id_value, api_url, api_id, is_active)
+        updated = db.update_model(model_id, name, model_id_value, api_url, api_id, is_active)
+        return updated
     except Exception as e:
         logger.error(f"Error updating model: {e}")
         return False
@@ -274,7 +353,8 @@ def delete_model(model_id: int) -> bool:
         bool: True if deleted successfully
     """
     try:
-        return db.delete_model(model_id)
+        deleted = db.delete_model(model_id)
+        return deleted
     except Exception as e:
         logger.error(f"Error deleting model: {e}")
         return False
@@ -33,7 +33,8 @@ class BaseAPIClient:
     Base class for API clients.
     """
     
-    def __init__(self, model: Model, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, model: Model, timeout: int = 30, max_retries: int = 3,
+                 session: Optional[requests.Session] = None):
         """
         Initialize API client.
         
@@ -41,10 +42,12 @@ class BaseAPIClient:
             model [in]: Model instance
             timeout [in]: Request timeout in seconds
             max_retries [in]: Maximum number of retry attempts
+            session [in]: Shared HTTP session for connection reuse (optional)
         """
         self.model = model
         self.timeout = timeout
         self.max_retries = max_retries
+        self.session = session
         
         # Load API key from environment
         api_key = os.getenv(model.api_id)
@@ -177,10 +180,11 @@ class BaseAPIClient:
         """
         # Local variables
         last_error = None
+        post = self.session.post if self.session is not None else requests.post
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = post(
                     url,
                     headers=headers,
                     json=payload,
@@ -474,7 +478,8 @@ class GroqAPIClient(BaseAPIClient):
 
 
 def create_api_client(model: Model, timeout: int = 30, 
-                      max_retries: int = 3) -> BaseAPIClient:
+                      max_retries: int = 3,
+                      session: Optional[requests.Session] = None) -> BaseAPIClient:
     """
     Create appropriate API client based on model configuration.
     
@@ -482,6 +487,7 @@ def create_api_client(model: Model, timeout: int = 30,
         model [in]: Model instance
         timeout [in]: Request timeout in seconds
         max_retries [in]: Maximum number of retry attempts
+        session [in]: Shared HTTP session for connection reuse (optional)
     
     Returns:
         BaseAPIClient: API client instance
@@ -494,21 +500,41 @@ def create_api_client(model: Model, timeout: int = 30,
     
     # Determine client type based on URL
     if "openrouter" in api_url_lower:
-        return OpenRouterAPIClient(model, timeout, max_retries)
+        return OpenRouterAPIClient(model, timeout, max_retries, session)
     elif "openai" in api_url_lower or "api.openai.com" in api_url_lower:
-        return OpenAIAPIClient(model, timeout, max_retries)
+        return OpenAIAPIClient(model, timeout, max_retries, session)
     elif "deepseek" in api_url_lower:
-        return DeepSeekAPIClient(model, timeout, max_retries)
+        return DeepSeekAPIClient(model, timeout, max_retries, session)
     elif "groq" in api_url_lower:
-        return GroqAPIClient(model, timeout, max_retries)
+        return GroqAPIClient(model, timeout, max_retries, session)
     else:
         # Default to OpenAI-compatible format (works for most providers)
         logger.info(f"Using OpenAI-compatible client for {model.name}")
-        return OpenAIAPIClient(model, timeout, max_retries)
+        return OpenAIAPIClient(model, timeout, max_retries, session)
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create HTTP session with keep-alive connection pooling.
+    
+    Args:
+        pool_size [in]: Maximum number of pooled connections per host
+    
+    Returns:
+        requests.Session: Session to share between concurrent requests
+    """
+    # Local variables
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def send_prompt_to_model(model: Model, prompt: str, 
-                        timeout: int = 30, max_retries: int = 3) -> str:
+                        timeout: int = 30, max_retries: int = 3,
+                        session: Optional[requests.Session] = None) -> str:
     """
     Send prompt to a model and get response.
     
@@ -517,6 +543,7 @@ def send_prompt_to_model(model: Model, prompt: str,
         prompt [in]: Prompt text
         timeout [in]: Request timeout in seconds
         max_retries [in]: Maximum number of retry attempts
+        session [in]: Shared HTTP session for connection reuse (optional)
     
     Returns:
         str: Response text
@@ -525,6 +552,6 @@ def send_prompt_to_model(model: Model, prompt: str,
         APIError: If request fails
     """
     # Local variables
-    client = create_api_client(model, timeout, max_retries)
+    client = create_api_client(model, timeout, max_retries, session)
     return client.send_request(prompt)
 